@@ -0,0 +1,95 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import json
+import os
+import sys
+import threading
+import traceback
+import zipfile
+
+from .. import config
+
+
+def get_traceback():
+    if sys.exc_info()[0]:
+        return traceback.format_exc()
+    return ''.join(traceback.format_stack()[:-2])
+
+
+def get_pk(instance, obj=None):
+    for entity in (obj, getattr(instance, 'entity', None),
+                   getattr(instance, 'postcard', None)):
+        if isinstance(entity, dict):
+            entity = entity.get('id')
+            if entity is not None:
+                return entity
+        elif entity is not None:
+            pk = getattr(entity, 'pk', None)
+            if pk is not None:
+                return pk
+    return None
+
+
+class Capture:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.executor = None
+
+    def get_executor(self):
+        with self.lock:
+            if not self.executor:
+                self.executor = ThreadPoolExecutor(max_workers=1)
+            return self.executor
+
+    def collect(self, instance, message=None, obj=None, page=True, **extra):
+        data = {
+            'time': datetime.now().isoformat(),
+            'class': instance.__class__.__name__,
+            'step': (
+                getattr(instance, 'step', None) or
+                getattr(instance, 'failed_step', None)
+            ),
+            'pk': get_pk(instance, obj),
+            'message': message,
+            'traceback': get_traceback(),
+            'extra': extra,
+        }
+        files = {}
+
+        driver = getattr(instance, 'driver', None)
+        if driver and page:
+            try:
+                data['url'] = driver.current_url
+                files['page.html'] = driver.page_source
+                files['screenshot.png'] = driver.get_screenshot_as_png()
+            except Exception as err:
+                data['driver_error'] = str(err)
+
+        return data, files
+
+    def capture(self, instance, **kwargs):
+        if not config.CAPTURE_FAILURES:
+            return None
+        data, files = self.collect(instance, **kwargs)
+        return self.get_executor().submit(self.write, data, files)
+
+    def write(self, data, files):
+        os.makedirs(config.CAPTURE_DIR, exist_ok=True)
+        path = os.path.join(config.CAPTURE_DIR, '{}-{}-{}.zip'.format(
+            datetime.now().strftime('%Y%m%d-%H%M%S-%f'),
+            data['class'],
+            data['pk'] if data['pk'] is not None else 'none',
+        ))
+
+        with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr(
+                'capture.json', json.dumps(data, indent=2, default=str)
+            )
+            for filename, content in files.items():
+                archive.writestr(filename, content)
+
+        print('Failure captured in {}.'.format(path))
+        return path
+
+
+capture = Capture()
@@ -0,0 +1,297 @@
+import re
+
+
+DAYS = (
+    'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday',
+    'Sunday'
+)
+
+# Paths inside a day row of the GBM hours dialog.
+ROW_PATHS = {
+    'checkbox': 'label/div',
+    'open_input': 'div[2]/div[1]/div/div[1]/div[1]/input[2]',
+    'open_options': 'div[2]/div[1]/div/div[1]/div[2]/div/div/div',
+    'close_input': 'div[2]/div[1]/div/div[2]/div[2]/div[1]/input[2]',
+    'close_options': 'div[2]/div[1]/div/div[2]/div[2]/div[2]/div/div/div',
+}
+
+# Labels GBM shows for a day open around the clock or closed.
+ALL_DAY_LABELS = ('open 24 hours', '24 hours')
+CLOSED_LABELS = ('closed',)
+
+# Milliseconds to wait for a dropdown and its options to render.
+OPTION_TIMEOUT = 1000
+
+# Run with execute_async_script: the options render after the input is
+# pressed, so every choice waits for them.
+HOURS_SCRIPT = r'''
+var rows = arguments[0], days = arguments[1], paths = arguments[2];
+var apply = arguments[3], labels = arguments[4], timeout = arguments[5];
+var done = arguments[arguments.length - 1];
+
+function find(root, path) {
+    return document.evaluate(
+        path, root, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+    ).singleNodeValue;
+}
+
+function findAll(root, path) {
+    var result = document.evaluate(
+        path, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+    );
+    var nodes = [];
+    for (var i = 0; i < result.snapshotLength; i++) {
+        nodes.push(result.snapshotItem(i));
+    }
+    return nodes;
+}
+
+function waitFor(get, callback, waited) {
+    var nodes = get();
+    waited = waited || 0;
+    if (nodes.length || waited >= timeout) {
+        callback(nodes);
+        return;
+    }
+    setTimeout(function () {
+        waitFor(get, callback, waited + 100);
+    }, 100);
+}
+
+function normalize(text) {
+    return (text || '').replace(/\s+/g, ' ').trim().toLowerCase();
+}
+
+function press(node) {
+    ['mousedown', 'mouseup', 'click'].forEach(function (type) {
+        node.dispatchEvent(new MouseEvent(type, {
+            bubbles: true, cancelable: true, view: window
+        }));
+    });
+}
+
+function choose(row, input, options, option, callback) {
+    waitFor(function () {
+        var node = find(row, input);
+        return node ? [node] : [];
+    }, function (inputs) {
+        if (!inputs.length) {
+            callback(null);
+            return;
+        }
+        press(inputs[0]);
+        waitFor(function () {
+            return findAll(row, options);
+        }, function (nodes) {
+            // Labels are matched first, positions start at 1.
+            var wanted = [].concat(option);
+            var match = null;
+            wanted.forEach(function (option) {
+                nodes.forEach(function (node) {
+                    var text = normalize(node.textContent);
+                    if (!match && typeof option === 'string' &&
+                            text === normalize(option)) {
+                        match = node;
+                    }
+                });
+                if (!match && typeof option === 'number') {
+                    match = nodes[option - 1] || null;
+                }
+            });
+            if (match) {
+                press(match);
+            }
+            callback(match ? match.textContent : null);
+        });
+    });
+}
+
+function value(row, path) {
+    // A hidden or disabled input holds no value for the day.
+    var input = find(row, path);
+    if (!input || input.disabled || input.offsetParent === null) {
+        return null;
+    }
+    return input.value;
+}
+
+var results = [];
+
+function next(i) {
+    if (i >= rows.length) {
+        done(results);
+        return;
+    }
+    var row = rows[i], day = days[i];
+    var checkbox = find(row, paths.checkbox);
+    var result = {open_option: null, close_option: null};
+
+    function finish() {
+        result.checked = checkbox && checkbox.getAttribute('aria-checked');
+        result.open = value(row, paths.open_input);
+        result.close = value(row, paths.close_input);
+        results.push(result);
+        next(i + 1);
+    }
+
+    if (!apply || !day || !checkbox) {
+        finish();
+        return;
+    }
+    var checked = checkbox.getAttribute('aria-checked') === 'true';
+    if (checked === day.closed) {
+        press(checkbox);
+    }
+    if (day.closed) {
+        finish();
+        return;
+    }
+    choose(
+        row, paths.open_input, paths.open_options,
+        day.all_day ? labels.concat([1]) : day.open,
+        function (label) {
+            result.open_option = label;
+            if (day.all_day) {
+                finish();
+                return;
+            }
+            choose(
+                row, paths.close_input, paths.close_options, day.close,
+                function (label) {
+                    result.close_option = label;
+                    finish();
+                }
+            );
+        }
+    );
+}
+
+next(0);
+'''
+
+
+def normalize(value):
+    return ' '.join(str(value or '').split()).lower()
+
+
+def parse_summary(text):
+    # Splits the hours summary of the edit page into the text of each day,
+    # whether the day is spelled out ('Monday') or shortened ('Mon').
+    text = normalize(text)
+    starts = []
+    for name in DAYS:
+        match = re.search(r'\b{}(?:{})?\b'.format(
+            name[:3].lower(), name[3:].lower()
+        ), text)
+        if match:
+            starts.append((match.start(), match.end(), name))
+    starts.sort()
+
+    summary = {}
+    for i, (start, end, name) in enumerate(starts):
+        stop = starts[i + 1][0] if i + 1 < len(starts) else len(text)
+        summary[name] = text[end:stop].strip(' :,')
+    return summary
+
+
+class Day:
+    def __init__(self, open=None, close=None, closed=False):
+        # `open` and `close` are option labels ('9:00 AM') or positions in
+        # the dropdown, starting at 1. No `open` means open 24 hours.
+        self.open = open
+        self.close = close
+        self.closed = closed
+
+    def __repr__(self):
+        if self.closed:
+            return 'Day(closed)'
+        if self.all_day:
+            return 'Day(24h)'
+        return 'Day({}-{})'.format(self.open, self.close)
+
+    @property
+    def all_day(self):
+        return not self.closed and self.open is None
+
+    def matches(self, result):
+        if result['checked'] != ('false' if self.closed else 'true'):
+            return False
+        if self.closed:
+            return True
+        if self.all_day:
+            # Open 24 hours shows its label, or hides the close input.
+            return bool(result['open']) and (
+                normalize(result['open']) in ALL_DAY_LABELS or
+                result['close'] is None
+            )
+        return (
+            self.matches_value(
+                self.open, result['open'], result.get('open_option')
+            ) and
+            self.matches_value(
+                self.close, result['close'], result.get('close_option')
+            )
+        )
+
+    def matches_summary(self, text):
+        if self.closed:
+            return any(label in text for label in CLOSED_LABELS)
+        if self.all_day:
+            return any(label in text for label in ALL_DAY_LABELS)
+        if isinstance(self.open, int) or isinstance(self.close, int):
+            return False
+        return normalize(self.open) in text and normalize(self.close) in text
+
+    def matches_value(self, option, value, chosen=None):
+        if not value:
+            return False
+        if isinstance(option, int):
+            # Positions are checked against the label that was picked.
+            return chosen is not None and normalize(chosen) == normalize(value)
+        return normalize(option) == normalize(value)
+
+    def to_dict(self):
+        return {
+            'open': self.open,
+            'close': self.close,
+            'closed': self.closed,
+            'all_day': self.all_day,
+        }
+
+
+class Hours:
+    def __init__(self, days):
+        assert len(days) == len(DAYS), "Hours need one Day per weekday."
+        self.days = list(days)
+
+    def __repr__(self):
+        return 'Hours({})'.format(', '.join(
+            '{} {}'.format(name[:3], day) for name, day in zip(DAYS, self.days)
+        ))
+
+    @classmethod
+    def all_day(cls):
+        return cls([Day() for name in DAYS])
+
+    @classmethod
+    def daily(cls, open, close):
+        return cls([Day(open, close) for name in DAYS])
+
+    def matches(self, results):
+        if not results or len(results) != len(self.days):
+            return False
+        return all(
+            day.matches(result) for day, result in zip(self.days, results)
+        )
+
+    def matches_summary(self, text):
+        summary = parse_summary(text)
+        if len(summary) != len(DAYS):
+            return False
+        return all(
+            day.matches_summary(summary[name])
+            for name, day in zip(DAYS, self.days)
+        )
+
+    def to_list(self):
+        return [day.to_dict() for day in self.days]
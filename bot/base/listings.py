@@ -0,0 +1,106 @@
+import re
+
+from .storage import BaseStorage
+
+
+LISTINGS_SCRIPT = r'''
+var paths = arguments[0];
+for (var i = 0; i < paths.length; i++) {
+    var result = document.evaluate(
+        paths[i], document, null,
+        XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+    );
+    var rows = [];
+    for (var j = 0; j < result.snapshotLength; j++) {
+        var row = result.snapshotItem(j);
+        rows.push({
+            cells: Array.prototype.map.call(
+                row.querySelectorAll('td'),
+                function (cell) { return cell.innerText; }
+            ),
+            links: Array.prototype.map.call(
+                row.querySelectorAll('a[href]'),
+                function (link) { return [link.textContent, link.href]; }
+            )
+        });
+    }
+    if (rows.length) {
+        return rows;
+    }
+}
+return [];
+'''
+
+LISTING_ID = re.compile(r'/l/(\d+)')
+
+STATUSES = (
+    'Verification required',
+    'Pending verification',
+    'Suspended',
+    'Published',
+)
+
+
+def normalize(name):
+    return ' '.join(str(name).split()).lower()
+
+
+def parse_row(row, position):
+    listing = None
+    for text, href in row['links']:
+        match = LISTING_ID.search(href)
+        if match and '/dashboard/' in href:
+            listing = {
+                'id': match.group(1),
+                'name': text.strip(),
+                'dashboard': href,
+                'edit': href.replace('/dashboard/', '/edit/'),
+                'verify': None,
+            }
+            break
+    if not listing:
+        return None
+
+    # Only a verification link shown on the row is used, never a guess.
+    for text, href in row['links']:
+        if '/verify/' in href:
+            listing['verify'] = href
+
+    listing['position'] = position
+    listing['status'] = None
+    for cell in row['cells']:
+        if cell.strip() in STATUSES:
+            listing['status'] = cell.strip()
+            break
+    return listing
+
+
+class ListingIndex(BaseStorage):
+    filename = 'listings.sqlite3'
+    table = 'listings'
+
+    def get_key(self, account, name):
+        return '{}:{}'.format(normalize(account), normalize(name))
+
+    def get_listing(self, account, *names, ttl=None):
+        for name in names:
+            if not name:
+                continue
+            listing = self.get(self.get_key(account, name), ttl=ttl)
+            if listing:
+                return listing
+        return None
+
+    def update(self, account, rows):
+        prefix = self.get_key(account, '')
+        for key in self.keys() if rows else []:
+            if key.startswith(prefix):
+                self.delete(key)
+
+        listings = []
+        for position, row in enumerate(rows):
+            listing = parse_row(row, position)
+            if listing:
+                self.set(self.get_key(account, listing['name']), listing)
+                listings.append(listing)
+        return listings
@@ -0,0 +1,63 @@
+import random
+import time
+
+from .. import config
+
+
+class RetryPolicy:
+    def __init__(
+        self, max_retries=None, deadline=None, backoff=None,
+        max_backoff=None, jitter=0.5, exceptions=(Exception,)
+    ):
+        self.max_retries = int(
+            config.MAX_RETRIES if max_retries is None else max_retries
+        )
+        self.deadline = float(
+            config.RETRY_DEADLINE if deadline is None else deadline
+        )
+        self.backoff = float(
+            config.RETRY_BACKOFF if backoff is None else backoff
+        )
+        self.max_backoff = float(
+            config.RETRY_MAX_BACKOFF if max_backoff is None else max_backoff
+        )
+        self.jitter = jitter
+        self.exceptions = tuple(exceptions)
+
+    def __repr__(self):
+        return (
+            'RetryPolicy(max_retries={}, deadline={}, backoff={}, '
+            'max_backoff={})'.format(
+                self.max_retries, self.deadline, self.backoff,
+                self.max_backoff
+            )
+        )
+
+    def replace(self, **kwargs):
+        values = dict(
+            max_retries=self.max_retries,
+            deadline=self.deadline,
+            backoff=self.backoff,
+            max_backoff=self.max_backoff,
+            jitter=self.jitter,
+            exceptions=self.exceptions,
+        )
+        values.update(kwargs)
+        return RetryPolicy(**values)
+
+    def get_delay(self, retry):
+        delay = min(self.backoff * 2 ** (retry - 1), self.max_backoff)
+        return delay * random.uniform(1 - self.jitter, 1)
+
+    def get_deadline(self, start, budget=None):
+        deadline = start + self.deadline if self.deadline else None
+        if budget is None:
+            return deadline
+        if deadline is None:
+            return budget
+        return min(deadline, budget)
+
+    def should_retry(self, retry, delay, deadline):
+        if retry >= self.max_retries:
+            return False
+        return deadline is None or time.time() + delay < deadline
@@ -1,11 +1,12 @@
 import os
 import pdb
 import platform
+import threading
 import time
 
 from selenium import webdriver
 from selenium.common.exceptions import (
-    TimeoutException, WebDriverException
+    NoSuchElementException, TimeoutException, WebDriverException
 )
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.by import By
@@ -15,8 +16,70 @@ from selenium.webdriver.chrome.options import Options
 from ..base.exceptions import (
     CredentialInvalid
 )
-from .. import config
+from .. import config, metrics
 from ..logger import Logger
+from .capture import capture
+from .hours import ALL_DAY_LABELS, HOURS_SCRIPT, OPTION_TIMEOUT, ROW_PATHS
+from .listings import LISTINGS_SCRIPT, ListingIndex, normalize
+from .retry import RetryPolicy
+from .shutdown import shutdown
+from .timings import STEP_PREFIXES, Timings, timed_step
+from .waits import get_call_site, waits
+from .watchdog import watchdog
+
+
+FIND_FIRST_SCRIPT = r'''
+var by = arguments[0], selectors = arguments[1];
+var root = arguments[2] || document;
+for (var i = 0; i < selectors.length; i++) {
+    var nodes = [];
+    if (by === 'xpath') {
+        var result = document.evaluate(
+            selectors[i], root, null,
+            XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+        );
+        for (var j = 0; j < result.snapshotLength; j++) {
+            nodes.push(result.snapshotItem(j));
+        }
+    } else {
+        nodes = Array.prototype.slice.call(
+            root.querySelectorAll(selectors[i])
+        );
+    }
+    nodes = nodes.filter(function (node) { return node.nodeType === 1; });
+    if (nodes.length) {
+        return [i, nodes];
+    }
+}
+return null;
+'''
+
+SET_VALUE_SCRIPT = r'''
+var element = arguments[0], value = arguments[1], blur = arguments[2];
+var prototype = (
+    element instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype :
+    element instanceof HTMLInputElement ? HTMLInputElement.prototype : null
+);
+if (!prototype) {
+    return null;
+}
+element.focus();
+Object.getOwnPropertyDescriptor(prototype, 'value').set.call(element, value);
+element.dispatchEvent(new Event('input', {bubbles: true}));
+element.dispatchEvent(new Event('change', {bubbles: true}));
+if (blur) {
+    element.blur();
+}
+return element.value;
+'''
+
+# Alternatives for these locators are looked up in a single script call.
+SCRIPT_LOCATORS = (By.XPATH, By.CSS_SELECTOR)
+
+KEY_CHARACTERS = ''.join(
+    value for name, value in vars(Keys).items()
+    if not name.startswith('_') and isinstance(value, str)
+)
 
 
 class BaseSelenium:
@@ -24,10 +87,34 @@ class BaseSelenium:
 
     def __init__(self, *args, **kwargs):
         self.logger = Logger()
+        self.timings = Timings(self.logger)
+        self.wait_site = None
+        self.step = None
+        self.failed_step = None
+        self.retry_policy = RetryPolicy()
+        self.listing_index = None
+        self.start_budget()
+        self.busy_since = None
+        self.recycle = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name, value in list(cls.__dict__.items()):
+            if (
+                name.startswith(STEP_PREFIXES) and callable(value) and
+                not getattr(value, 'timed', False)
+            ):
+                setattr(cls, name, timed_step(value))
 
     def get_driver(self, size=None):
         if hasattr(self, 'driver') and self.driver:
-            return self.driver
+            if not getattr(self, 'recycle', False):
+                return self.driver
+            try:
+                self.quit_driver()
+            except Exception as err:
+                print(err)
+            self.recycle = False
 
         if platform.system() == 'Windows':
             options = Options()
@@ -50,6 +137,11 @@ class BaseSelenium:
 
             driver = webdriver.Chrome(chrome_options=options)
 
+        self.browser_open = True
+        metrics.active_browsers.inc()
+        shutdown.add(self)
+        watchdog.add(self, driver)
+
         if size:
             try:
                 width, height = size
@@ -65,25 +157,73 @@ class BaseSelenium:
 
         return driver
 
-    def quit_driver(self):
+    def restart_driver(self):
+        # Moves the job to a fresh browser between steps: the cookies and
+        # the page carry over, so the job goes on logged in where it was.
+        driver = getattr(self, 'driver', None)
+        if not driver:
+            return False
+
+        url = None
+        size = {'width': 1200, 'height': 700}
+        cookies = None
+        try:
+            if len(driver.window_handles) > 1:
+                return False
+            url = driver.current_url
+            size = driver.get_window_size()
+            cookies = driver.execute_cdp_cmd('Network.getAllCookies', {})
+        except Exception as err:
+            # The watchdog killed it as unresponsive, start from scratch.
+            print(err)
+
+        try:
+            self.quit_driver(report=False)
+        except Exception as err:
+            print(err)
+        self.driver = None
+        self.recycle = False
+        self.driver = self.get_driver(size=(size['width'], size['height']))
+        if cookies:
+            self.driver.execute_cdp_cmd('Network.setCookies', {
+                'cookies': cookies['cookies']
+            })
+        if url:
+            self.driver.get(url)
+        return True
+
+    def quit_driver(self, report=True):
+        if report:
+            self.timings.report()
+        waits.flush()
         try:
             self.driver.switch_to.window(self.driver.window_handles[0])
             self.logger(data="Closing at {}.".format(self.driver.current_url))
             self.driver.quit()
         except AttributeError:
             pass
+        finally:
+            shutdown.discard(self)
+            watchdog.discard(self)
+            if getattr(self, 'listing_index', None):
+                self.listing_index.close()
+                self.listing_index = None
+            if getattr(self, 'browser_open', False):
+                self.browser_open = False
+                metrics.active_browsers.dec()
 
     def perform_action(func):
         def wrapper(self, by, selector, *args, **kwargs):
             retry = 0
             success = False
 
-            try:
-                max_retries = int(
-                    kwargs.get('max_retries', config.MAX_RETRIES)
-                )
-            except ValueError:
-                max_retries = config.MAX_RETRIES
+            policy = kwargs.get('retry') or self.retry_policy
+            for name in ('max_retries', 'deadline'):
+                try:
+                    if name in kwargs:
+                        policy = policy.replace(**{name: kwargs[name]})
+                except ValueError:
+                    pass
 
             try:
                 timeout = int(kwargs.get('timeout', 0))
@@ -93,41 +233,74 @@ class BaseSelenium:
             return_method = func.__name__.startswith('get_')
             raise_exception = kwargs.get('raise_exception', True)
 
+            start = time.time()
+            retry_start = None
+            webdriver = 0
+
+            def record():
+                self.timings.add_action(
+                    func.__name__,
+                    time.time() - start,
+                    webdriver,
+                    time.time() - retry_start if retry_start else 0
+                )
+                if self.wait_site:
+                    waits.add_result(self.wait_site, success and retry == 1)
+                    self.wait_site = None
+
             if timeout:
-                self._wait(timeout)
+                self._wait(timeout, site=get_call_site())
+
+            if not isinstance(selector, (list, tuple)):
+                selector = [selector]
+            elif len(selector) > 1 and by in SCRIPT_LOCATORS:
+                selector = [tuple(selector)]
+            deadline = policy.get_deadline(time.time(), self.deadline)
 
             while not success:
+                shutdown.check()
                 retry += 1
-
-                if retry > max_retries:
+                if retry == 2:
+                    retry_start = time.time()
+
+                for s in selector:
+                    if retry > 1:
+                        self.timings.add_retry(
+                            s if isinstance(s, str) else ' | '.join(s)
+                        )
+                    self.logger(data={
+                        'action': func.__name__,
+                        'selector': s,
+                        'args': args,
+                        'retry': retry,
+                    })
+                    call_start = time.time()
+                    self.busy_since = call_start
+                    try:
+                        response = func(self, by, s, *args, **kwargs)
+                        success = True
+                        break
+                    except policy.exceptions:
+                        pass
+                    finally:
+                        self.busy_since = None
+                        webdriver += time.time() - call_start
+
+                if success:
+                    break
+
+                delay = policy.get_delay(retry)
+                if not policy.should_retry(retry, delay, deadline):
+                    record()
                     if raise_exception:
                         self._start_debug()
                         raise TimeoutException
                     else:
                         return success
 
-                try:
-                    if not isinstance(selector, (list, tuple)):
-                        selector = [selector]
-
-                    for s in selector:
-                        try:
-                            self.logger(data={
-                                'action': func.__name__,
-                                'selector': s,
-                                'args': args,
-                                'retry': retry,
-                            })
-                            response = func(self, by, s, *args, **kwargs)
-                            success = True
-                            break
-                        except Exception:
-                            pass
-                    if not success:
-                        raise TimeoutException
-                except (TimeoutException, WebDriverException):
-                    self._wait(1)
+                self._wait(delay, site='retry')
 
+            record()
             return response if return_method else success
 
         return wrapper
@@ -136,8 +309,7 @@ class BaseSelenium:
     def click_element(
         self, by, selector, source=None, move=False, *args, **kwargs
     ):
-        final_source = source or self.driver
-        element = final_source.find_element(by, selector)
+        element = self.find_element(by, selector, source)
 
         if move:
             ActionChains(self.driver) \
@@ -152,12 +324,12 @@ class BaseSelenium:
 
     @perform_action
     def clear_input(self, by, selector, source=None, *args, **kwargs):
-        source = source or self.driver
-        element = source.find_element(by, selector)
+        element = self.find_element(by, selector, source)
         element.clear()
 
+    @timed_step
     def do_login(self, credential, url=None):
-        url = url or 'https://business.google.com/locations'
+        url = url or config.GBM_URL + '/locations'
         final_url = url.split('.com')[0]
 
         self.driver.get(url)
@@ -231,22 +403,22 @@ class BaseSelenium:
 
     @perform_action
     def fill_input(self, by, selector, content, source=None, *args, **kwargs):
-        source = source or self.driver
-        element = source.find_element(by, selector)
+        element = self.find_element(by, selector, source)
+        mode = kwargs.get('mode', config.INPUT_MODE)
+        if mode == 'script' and self.set_value(element, content):
+            return
         element.send_keys(content)
 
     @perform_action
     def get_text(self, by, selector, source=None, *args, **kwargs):
-        source = source or self.driver
-        element = source.find_element(by, selector)
+        element = self.find_element(by, selector, source)
         return element.text
 
     @perform_action
     def get_element(
         self, by, selector, source=None, move=False, *args, **kwargs
     ):
-        source = source or self.driver
-        element = source.find_element(by, selector)
+        element = self.find_element(by, selector, source)
 
         if move:
             ActionChains(self.driver) \
@@ -257,23 +429,163 @@ class BaseSelenium:
 
     @perform_action
     def get_elements(self, by, selector, source=None, *args, **kwargs):
-        source = source or self.driver
-        elements = source.find_elements(by, selector)
+        elements = self.find_elements(by, selector, source)
         if len(elements) == 0:
             raise WebDriverException
         return elements
 
+    def find_element(self, by, selector, source=None):
+        if isinstance(selector, tuple):
+            return self.find_first(by, selector, source)[1][0]
+        return (source or self.driver).find_element(by, selector)
+
+    def find_elements(self, by, selector, source=None):
+        if isinstance(selector, tuple):
+            return self.find_first(by, selector, source)[1]
+        return (source or self.driver).find_elements(by, selector)
+
+    def find_first(self, by, selectors, source=None):
+        match = self.driver.execute_script(
+            FIND_FIRST_SCRIPT, by, list(selectors), source
+        )
+        if not match:
+            raise NoSuchElementException(
+                'None of {} matched.'.format(selectors)
+            )
+        index, elements = match
+        self.logger(data={'selector': selectors[index], 'alternative': index})
+        return index, elements
+
+    def set_value(self, element, content):
+        # Special keys (e.g. a trailing Keys.RETURN) are still typed.
+        text = content.rstrip(KEY_CHARACTERS)
+        keys = content[len(text):]
+        if any(character in KEY_CHARACTERS for character in text):
+            return False
+
+        value = self.driver.execute_script(
+            SET_VALUE_SCRIPT, element, text, not keys
+        )
+        if value != text:
+            self.logger(data={'set_value': 'mismatch', 'value': value})
+            if value is not None:
+                element.clear()
+            return False
+
+        if keys:
+            element.send_keys(keys)
+        return True
+
+    def get_listing_index(self):
+        if not self.listing_index:
+            self.listing_index = ListingIndex()
+        return self.listing_index
+
+    def open_listing(self, listing, names=()):
+        # Stored URLs go stale when a listing is renamed, removed or moved to
+        # another account, so the page has to show the right business.
+        self.driver.get(listing['edit'])
+        text = self.get_text(
+            By.TAG_NAME, 'body', raise_exception=False, max_retries=2
+        )
+        if '/l/{}'.format(listing['id']) not in self.driver.current_url:
+            return False
+        if names and not any(
+            name and normalize(name) in normalize(text or '')
+            for name in names
+        ):
+            return False
+        return True
+
+    def read_listings(self, account, rows):
+        try:
+            rows = self.driver.execute_script(LISTINGS_SCRIPT, list(rows))
+        except WebDriverException as err:
+            self.logger(data="Cannot read the locations: {}".format(err))
+            return []
+        return self.get_listing_index().update(account, rows or [])
+
+    def set_hours(self, rows, hours):
+        days = hours.to_list()
+        results = None
+        try:
+            # A second pass picks the options that rendered too late.
+            for attempt in range(2):
+                results = self.driver.execute_async_script(
+                    HOURS_SCRIPT, rows, days, ROW_PATHS, True,
+                    list(ALL_DAY_LABELS), OPTION_TIMEOUT
+                )
+                if hours.matches(results):
+                    break
+        except WebDriverException as err:
+            results = str(err)
+
+        if hours.matches(results):
+            return True
+
+        self.logger(data={'set_hours': 'mismatch', 'results': results})
+        for row, day in zip(rows, hours.days):
+            checkbox = self.get_element(
+                By.XPATH, ROW_PATHS['checkbox'], source=row
+            )
+            checked = checkbox.get_attribute('aria-checked') == 'true'
+            if checked == day.closed:
+                checkbox.click()
+            if day.closed:
+                continue
+            self.choose_hours_option(
+                row, 'open', 1 if day.all_day else day.open
+            )
+            if not day.all_day:
+                self.choose_hours_option(row, 'close', day.close)
+        return False
+
+    def choose_hours_option(self, row, name, option):
+        self.click_element(
+            By.XPATH, ROW_PATHS[name + '_input'], source=row
+        )
+        if isinstance(option, int):
+            xpath = '{}[{}]'.format(ROW_PATHS[name + '_options'], option)
+        else:
+            xpath = '{}[normalize-space()="{}"]'.format(
+                ROW_PATHS[name + '_options'], option
+            )
+        self.click_element(
+            By.XPATH, xpath, source=row, raise_exception=False
+        )
+
     def handle(self):
         raise NotImplementedError("`handle` nor implemented in the Base.")
 
-    def _wait(self, seconds):
-        for second in range(seconds):
+    def start_budget(self, seconds=None):
+        seconds = config.JOB_BUDGET if seconds is None else seconds
+        self.deadline = time.time() + seconds if seconds else None
+
+    def _wait(self, seconds, site=None):
+        site = site or get_call_site()
+        seconds = waits.get_seconds(site, seconds)
+        start = time.time()
+        for second in range(int(seconds)):
             if config.DEBUG:
-                print('Wait: {:d}/{:d}'.format(second + 1, seconds))
-            time.sleep(1)
+                print('Wait: {:d}/{:d}'.format(second + 1, int(seconds)))
+            shutdown.sleep(1)
+        if seconds % 1:
+            shutdown.sleep(seconds % 1)
+        self.timings.add_sleep(time.time() - start)
+        metrics.wait_seconds.inc(time.time() - start)
+        waits.add_sleep(site, time.time() - start)
+        if site != 'retry':
+            self.wait_site = site
 
     def _start_debug(self, *args, **kwargs):
         if 'message' in kwargs:
             print(kwargs['message'])
-        if config.PDB_DEBUG:
+        try:
+            capture.capture(self, **kwargs)
+        except Exception as err:
+            print(err)
+        if (
+            config.PDB_DEBUG and config.WORKERS == 1 and
+            threading.current_thread() is threading.main_thread()
+        ):
             pdb.set_trace()
@@ -1,11 +1,12 @@
 import json
+import time
 
 from datetime import datetime
 from urllib.parse import urlparse, parse_qs
 
 import requests
 
-from .. import config
+from .. import config, metrics
 from ..logger import Logger
 
 
@@ -229,7 +230,13 @@ class BaseService:
             'endpoint': endpoint,
             'data': log_kwargs
         })
+        start = time.time()
         r = getattr(requests, method)(endpoint, **kwargs)
+        metrics.api_request_seconds.observe(
+            time.time() - start,
+            service=self.__class__.__name__,
+            method=method
+        )
         assert r.status_code >= 200 and r.status_code < 300, (
             "%s: Request error: %s" % (self.__class__.__name__, r.json())
         )
@@ -0,0 +1,75 @@
+import signal
+import threading
+import weakref
+
+from .. import config
+from .exceptions import TerminatedByUser
+
+
+class Shutdown:
+    def __init__(self):
+        self.stopping = threading.Event()
+        self.cancelled = threading.Event()
+        self.timer = None
+        self.lock = threading.Lock()
+        self.instances = weakref.WeakSet()
+
+    def add(self, instance):
+        with self.lock:
+            self.instances.add(instance)
+
+    def cancel(self):
+        self.stopping.set()
+        self.cancelled.set()
+
+    def check(self):
+        if self.cancelled.is_set():
+            raise TerminatedByUser("Shutdown requested.")
+
+    def discard(self, instance):
+        with self.lock:
+            self.instances.discard(instance)
+
+    def install(self):
+        if threading.current_thread() is not threading.main_thread():
+            return
+        signal.signal(signal.SIGINT, self.request)
+        signal.signal(signal.SIGTERM, self.request)
+
+    def is_stopping(self):
+        return self.stopping.is_set()
+
+    def quit_drivers(self):
+        with self.lock:
+            instances = list(self.instances)
+        for instance in instances:
+            try:
+                instance.quit_driver()
+            except Exception as err:
+                print(err)
+
+    def request(self, signum=None, frame=None):
+        if self.stopping.is_set():
+            print('Shutting down now.')
+            self.cancel()
+            return
+
+        print(
+            'Shutting down: no new jobs, waiting up to {} seconds for the '
+            'running ones. Interrupt again to stop now.'
+            .format(config.DRAIN_TIMEOUT)
+        )
+        self.stopping.set()
+        self.timer = threading.Timer(config.DRAIN_TIMEOUT, self.cancel)
+        self.timer.daemon = True
+        self.timer.start()
+
+    def sleep(self, seconds):
+        if self.cancelled.wait(seconds):
+            raise TerminatedByUser("Shutdown requested.")
+
+    def wait(self, seconds):
+        return self.stopping.wait(seconds)
+
+
+shutdown = Shutdown()
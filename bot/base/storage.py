@@ -0,0 +1,80 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from .. import config
+
+
+class BaseStorage:
+    filename = None
+    table = 'items'
+
+    def __init__(self, filename=None):
+        filename = filename or self.filename
+        assert filename, (
+            "%s: A filename is required." % self.__class__.__name__
+        )
+        self.path = os.path.join(config.STORAGE_DIR, filename)
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(
+            self.path, check_same_thread=False
+        )
+        with self.lock, self.connection:
+            self.connection.execute(
+                'CREATE TABLE IF NOT EXISTS {} ('
+                'key TEXT PRIMARY KEY, value TEXT, updated REAL)'
+                .format(self.table)
+            )
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
+
+    def delete(self, key):
+        with self.lock, self.connection:
+            self.connection.execute(
+                'DELETE FROM {} WHERE key = ?'.format(self.table), (key,)
+            )
+
+    def get(self, key, ttl=None):
+        with self.lock:
+            row = self.connection.execute(
+                'SELECT value, updated FROM {} WHERE key = ?'
+                .format(self.table),
+                (key,)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        value, updated = row
+        if ttl is not None and time.time() - updated > ttl:
+            return None
+        return json.loads(value)
+
+    def items(self):
+        with self.lock:
+            rows = self.connection.execute(
+                'SELECT key, value FROM {}'.format(self.table)
+            ).fetchall()
+        return [(key, json.loads(value)) for key, value in rows]
+
+    def keys(self):
+        with self.lock:
+            rows = self.connection.execute(
+                'SELECT key FROM {}'.format(self.table)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def set(self, key, value):
+        with self.lock, self.connection:
+            self.connection.execute(
+                'INSERT OR REPLACE INTO {} (key, value, updated) '
+                'VALUES (?, ?, ?)'.format(self.table),
+                (key, json.dumps(value), time.time())
+            )
@@ -0,0 +1,154 @@
+from collections import Counter
+import functools
+import threading
+import time
+
+
+STEP_PREFIXES = ('do_', 'go_to_')
+
+BUCKETS = (0.1, 0.5, 1, 2, 5, 10, 30, 60, 120, 300)
+
+
+class Histogram:
+    def __init__(self):
+        self.buckets = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def add(self, seconds):
+        index = len(BUCKETS)
+        for i, bucket in enumerate(BUCKETS):
+            if seconds <= bucket:
+                index = i
+                break
+        self.buckets[index] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0
+
+
+class Histograms:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.items = {}
+
+    def add(self, name, seconds):
+        with self.lock:
+            self.items.setdefault(name, Histogram()).add(seconds)
+
+    def summary(self):
+        with self.lock:
+            items = sorted(
+                self.items.items(), key=lambda item: -item[1].total
+            )
+            return [
+                '{:<32} {:5d}x  total {:8.1f}s  mean {:6.2f}s  '
+                'max {:6.2f}s'.format(
+                    name, h.count, h.total, h.mean, h.max
+                )
+                for name, h in items
+            ]
+
+
+histograms = Histograms()
+
+
+def print_summary(limit=20):
+    lines = histograms.summary()[:limit]
+    if lines:
+        print('== slowest spans')
+        for line in lines:
+            print('  ' + line)
+
+
+class Timings:
+    def __init__(self, logger=None):
+        self.logger = logger
+        self.start = time.time()
+        self.steps = Counter()
+        self.actions = Counter()
+        self.retries = Counter()
+        self.sleep = 0
+        self.webdriver = 0
+        self.retry = 0
+        self.reported = False
+
+    def add_action(self, name, seconds, webdriver, retry):
+        self.actions[name] += seconds
+        self.webdriver += webdriver
+        self.retry += retry
+        histograms.add('action.' + name, seconds)
+
+    def add_retry(self, selector):
+        self.retries[selector] += 1
+
+    def add_sleep(self, seconds):
+        self.sleep += seconds
+        histograms.add('sleep', seconds)
+
+    def add_step(self, name, seconds):
+        self.steps[name] += seconds
+        histograms.add('step.' + name, seconds)
+        self.log(span='step', name=name, seconds=round(seconds, 3))
+
+    def log(self, **data):
+        if self.logger:
+            self.logger(data=data)
+
+    def get_totals(self):
+        return {
+            'total': time.time() - self.start,
+            'sleep': self.sleep,
+            'webdriver': self.webdriver,
+            'retry': self.retry,
+        }
+
+    def report(self):
+        if self.reported:
+            return
+        self.reported = True
+
+        totals = {k: round(v, 3) for k, v in self.get_totals().items()}
+        self.log(
+            span='job',
+            steps={k: round(v, 3) for k, v in self.steps.items()},
+            retries=dict(self.retries.most_common(10)),
+            **totals
+        )
+        print(
+            'Job took {total:.1f}s: {sleep:.1f}s sleeping, {webdriver:.1f}s '
+            'in WebDriver, {retry:.1f}s retrying.'.format(**totals)
+        )
+        for name, seconds in self.steps.most_common(5):
+            print('  {:<32} {:8.1f}s'.format(name, seconds))
+
+
+def timed_step(func):
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if not getattr(self, 'step', None):
+            self.failed_step = None
+            if getattr(self, 'recycle', False):
+                # Bots that keep one browser per job never reach get_driver
+                # again, so the watchdog's request is honoured between steps.
+                self.restart_driver()
+        start = time.time()
+        step, self.step = getattr(self, 'step', None), func.__name__
+        try:
+            return func(self, *args, **kwargs)
+        except Exception:
+            # The innermost failing step is kept for captures.
+            if not getattr(self, 'failed_step', None):
+                self.failed_step = func.__name__
+            raise
+        finally:
+            self.step = step
+            self.timings.add_step(func.__name__, time.time() - start)
+
+    wrapper.timed = True
+    return wrapper
@@ -0,0 +1,111 @@
+import os
+import sys
+import threading
+
+from .. import config
+from .storage import BaseStorage
+
+
+# A wait is redundant when the action after it almost always works on the
+# first try.
+REDUNDANT_MIN_SAMPLES = 20
+
+REDUNDANT_RATE = 0.95
+
+
+def get_call_site(depth=1):
+    frame = sys._getframe(depth + 1)
+    filename = os.path.relpath(frame.f_code.co_filename, config.BASE_DIR)
+    return '{}:{} {}'.format(filename, frame.f_lineno, frame.f_code.co_name)
+
+
+class WaitIndex(BaseStorage):
+    filename = 'waits.sqlite3'
+    table = 'sites'
+
+
+class WaitBudget:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.index = None
+        self.sites = None
+        self.pending = {}
+
+    def get_sites(self):
+        if self.sites is None:
+            self.index = WaitIndex()
+            self.sites = dict(self.index.items())
+        return self.sites
+
+    def get_stats(self, site):
+        with self.lock:
+            sites = self.get_sites()
+            if site not in sites:
+                sites[site] = {
+                    'seconds': 0, 'count': 0, 'followed': 0, 'first_try': 0
+                }
+            self.pending[site] = sites[site]
+            return sites[site]
+
+    def add_result(self, site, first_try):
+        stats = self.get_stats(site)
+        with self.lock:
+            stats['followed'] += 1
+            stats['first_try'] += 1 if first_try else 0
+
+    def add_sleep(self, site, seconds):
+        stats = self.get_stats(site)
+        with self.lock:
+            stats['seconds'] += seconds
+            stats['count'] += 1
+
+    def flush(self):
+        with self.lock:
+            pending, self.pending = self.pending, {}
+        for site, stats in pending.items():
+            self.index.set(site, stats)
+
+    def get_seconds(self, site, seconds):
+        if not config.FAST_WAITS or not self.is_redundant(site):
+            return seconds
+        return int(round(seconds * config.WAIT_SCALE))
+
+    def is_redundant(self, site):
+        stats = self.get_stats(site)
+        if stats['followed'] < REDUNDANT_MIN_SAMPLES:
+            return False
+        return stats['first_try'] / stats['followed'] >= REDUNDANT_RATE
+
+    def summary(self):
+        with self.lock:
+            sites = sorted(
+                self.get_sites().items(), key=lambda item: -item[1]['seconds']
+            )
+
+        lines = []
+        for site, stats in sites:
+            rate = (
+                '{:5.0%}'.format(stats['first_try'] / stats['followed'])
+                if stats['followed'] else '    -'
+            )
+            lines.append(
+                '{:9.0f}s {:6d}x  first try {}  {}{}'.format(
+                    stats['seconds'],
+                    stats['count'],
+                    rate,
+                    site,
+                    ' (redundant)' if self.is_redundant(site) else ''
+                )
+            )
+        return lines
+
+
+waits = WaitBudget()
+
+
+def run(*args, **kwargs):
+    lines = waits.summary()
+    if not lines:
+        print('No waits recorded yet.')
+    for line in lines:
+        print(line)
@@ -0,0 +1,180 @@
+import threading
+import time
+
+import psutil
+
+from .. import config, metrics
+from .storage import BaseStorage
+
+
+def get_tree(pid):
+    try:
+        process = psutil.Process(pid)
+        return [process] + process.children(recursive=True)
+    except psutil.Error:
+        return []
+
+
+def kill_tree(processes):
+    for process in processes:
+        try:
+            process.kill()
+        except psutil.Error:
+            pass
+    psutil.wait_procs(processes, timeout=5)
+
+
+def is_running(pid, started):
+    # Compare start times so a recycled pid is not mistaken for ours.
+    try:
+        return abs(psutil.Process(pid).create_time() - started) < 0.01
+    except psutil.Error:
+        return False
+
+
+class LaunchedBrowsers(BaseStorage):
+    filename = 'browsers.sqlite3'
+    table = 'browsers'
+
+
+class Watchdog:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.instances = {}
+        self.processes = {}
+        self.thread = None
+        self.storage = None
+        self.owner = psutil.Process()
+
+    def get_storage(self):
+        with self.lock:
+            if not self.storage:
+                self.storage = LaunchedBrowsers()
+            return self.storage
+
+    def add(self, instance, driver):
+        try:
+            pid = driver.service.process.pid
+        except AttributeError:
+            return
+        with self.lock:
+            self.instances[instance] = pid
+        self.remember(pid, get_tree(pid))
+
+    def remember(self, pid, tree):
+        # Every launched process is stored so that a later run can kill
+        # what this one leaves behind, whoever adopts the processes.
+        storage = self.get_storage()
+        for process in tree:
+            if process.pid in self.processes:
+                continue
+            try:
+                started = process.create_time()
+            except psutil.Error:
+                continue
+            self.processes[process.pid] = process
+            storage.set(str(process.pid), {
+                'driver': pid,
+                'started': started,
+                'owner': self.owner.pid,
+                'owner_started': self.owner.create_time(),
+            })
+
+    def forget(self, pid):
+        storage = self.get_storage()
+        for key, value in storage.items():
+            if value['driver'] == pid and value['owner'] == self.owner.pid:
+                storage.delete(key)
+                self.processes.pop(int(key), None)
+
+    def discard(self, instance):
+        with self.lock:
+            pid = self.instances.pop(instance, None)
+        if pid is not None:
+            # Anything left after quit() is a leak.
+            kill_tree(get_tree(pid))
+            self.forget(pid)
+
+    def check(self):
+        with self.lock:
+            instances = list(self.instances.items())
+
+        for instance, pid in instances:
+            tree = get_tree(pid)
+            if not tree:
+                continue
+            self.remember(pid, tree)
+
+            rss = 0
+            cpu = 0
+            for process in tree:
+                process = self.processes.get(process.pid, process)
+                try:
+                    rss += process.memory_info().rss
+                    cpu += process.cpu_percent(None)
+                except psutil.Error:
+                    pass
+            rss = rss / 1024 / 1024
+
+            busy_since = getattr(instance, 'busy_since', None)
+            busy = time.time() - busy_since if busy_since else 0
+            if busy > config.WATCHDOG_TIMEOUT:
+                self.recycle(instance, 'unresponsive', rss, cpu)
+                with self.lock:
+                    self.instances.pop(instance, None)
+                kill_tree(tree)
+                self.forget(pid)
+            elif rss > config.WATCHDOG_MAX_RSS:
+                self.recycle(instance, 'memory', rss, cpu)
+            elif cpu > config.WATCHDOG_MAX_CPU:
+                self.recycle(instance, 'cpu', rss, cpu)
+
+    def recycle(self, instance, reason, rss, cpu):
+        if getattr(instance, 'recycle', False):
+            return
+        instance.recycle = True
+        metrics.browser_recycles.inc(reason=reason)
+        instance.logger(data={
+            'watchdog': reason, 'rss_mb': round(rss), 'cpu': round(cpu)
+        })
+        print('Watchdog: recycling browser ({}, {:.0f}MB, {:.0f}% CPU).'
+              .format(reason, rss, cpu))
+
+    def reap_orphans(self):
+        storage = self.get_storage()
+        orphans = []
+        for key, value in storage.items():
+            if is_running(value['owner'], value['owner_started']):
+                continue
+            # The run that launched it is gone, nothing will quit it.
+            storage.delete(key)
+            pid = int(key)
+            if is_running(pid, value['started']):
+                orphans += get_tree(pid)
+
+        if orphans:
+            print('Watchdog: reaping {} orphaned browser processes.'.format(
+                len(orphans)
+            ))
+            metrics.orphans_reaped.inc(len(orphans))
+            kill_tree(orphans)
+
+    def run(self):
+        while True:
+            time.sleep(config.WATCHDOG_INTERVAL)
+            try:
+                self.check()
+                self.reap_orphans()
+            except Exception as err:
+                print('Watchdog: {}'.format(err))
+
+    def start(self):
+        if not config.WATCHDOG_INTERVAL or self.thread:
+            return
+        self.reap_orphans()
+        self.thread = threading.Thread(target=self.run)
+        self.thread.daemon = True
+        self.thread.start()
+
+
+watchdog = Watchdog()
@@ -0,0 +1,247 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import random
+import threading
+import time
+from urllib.parse import parse_qs, urlencode, urlparse
+
+from .pages import BUSINESS
+
+
+def business(pk):
+    return dict(
+        BUSINESS, id=pk, name='{} {}'.format(BUSINESS['name'], pk),
+        date_fail=None, date_success=None, date_pending=None,
+    )
+
+
+def account(pk):
+    return {
+        'id': pk,
+        'username': 'bench{}@example.com'.format(pk),
+        'password': BUSINESS['password'],
+        'is_active': True,
+    }
+
+
+RESOURCES = {
+    '/renamer/business/': business,
+    '/mixer/credentials/': lambda pk: {
+        'id': pk,
+        'email': 'bench{}@example.com'.format(pk),
+        'password': BUSINESS['password'],
+        'recovery_email': BUSINESS['recovery_email'],
+    },
+    '/panel/seo/accounts/': account,
+    '/panel/seo/codes/': lambda pk: {
+        'id': pk,
+        'person': {
+            'id': pk,
+            'first_name': 'Bench',
+            'phone': BUSINESS['final_phone_number'],
+        },
+        'code_1': None,
+        'code_2': None,
+        'code_3': None,
+        'status': None,
+        'user': None,
+    },
+    '/panel/seo/gmbs/': lambda pk: dict(
+        business(pk), account=pk, is_created=False
+    ),
+    '/panel/seo/gmb-tasks/': lambda pk: dict(
+        account(pk), status='pending'
+    ),
+    '/panel/seo/postcards/': lambda pk: {
+        'id': pk,
+        'name': '{} {}'.format(BUSINESS['name'], pk),
+        'status': 'not-created',
+        'recipient': None,
+        'account': account(pk),
+        'country': {'code': 'US'},
+        'state': BUSINESS['final_state'],
+        'city': BUSINESS['final_city'],
+        'zip_code': BUSINESS['final_zip_code'],
+        'address': BUSINESS['final_address'],
+        'category': BUSINESS['final_category_1'],
+        'phone': BUSINESS['final_phone_number'],
+    },
+    '/panel/crm/leads/': lambda pk: {
+        'id': pk, 'name': 'Lead {}'.format(pk), 'status': None
+    },
+}
+
+ACTIONS = {
+    'set-fail': 'date_fail',
+    'set-pending': 'date_pending',
+    'set-success': 'date_success',
+}
+
+PAGE_SIZE = 100
+
+
+class APIHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_DELETE(self):
+        self.handle_request('delete')
+
+    def do_GET(self):
+        self.handle_request('get')
+
+    def do_PATCH(self):
+        self.handle_request('patch')
+
+    def do_POST(self):
+        self.handle_request('post')
+
+    def do_PUT(self):
+        self.handle_request('put')
+
+    def get_data(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length).decode('utf-8') if length else ''
+        if not body:
+            return {}
+        if 'json' in self.headers.get('Content-Type', ''):
+            return json.loads(body)
+        return {k: v[-1] for k, v in parse_qs(body).items()}
+
+    def handle_request(self, method):
+        url = urlparse(self.path)
+        data = self.get_data()
+
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        if random.random() < self.server.error_rate:
+            return self.send_json({'detail': 'Bench error.'}, status=500)
+
+        if url.path.endswith('/account/login/') and method == 'post':
+            return self.send_json({'token': 'bench'})
+
+        if self.headers.get('Authorization') != 'Token bench':
+            return self.send_json({'detail': 'Unauthorized.'}, status=401)
+
+        endpoint, pk, extra = self.server.resolve(url.path)
+        if endpoint is None:
+            return self.send_json({'detail': 'Not found.'}, status=404)
+
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        status, response = self.server.dispatch(
+            method, endpoint, pk, extra, query, data
+        )
+        self.send_json(response, status=status)
+
+    def send_json(self, content, status=200):
+        content = json.dumps(content).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+
+class APIServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self, host='127.0.0.1', port=0, size=100, latency=0, error_rate=0
+    ):
+        super().__init__((host, port), APIHandler)
+        self.latency = latency
+        self.error_rate = error_rate
+        self.lock = threading.Lock()
+        self.thread = None
+        self.data = {
+            endpoint: {pk: factory(pk) for pk in range(1, size + 1)}
+            for endpoint, factory in RESOURCES.items()
+        }
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def get_url(self):
+        host, port = self.server_address[:2]
+        return 'http://{}:{}/api'.format(host, port)
+
+    def resolve(self, path):
+        if path.startswith('/api/'):
+            path = path[len('/api'):]
+        for endpoint in self.data:
+            if not path.startswith(endpoint):
+                continue
+            parts = [p for p in path[len(endpoint):].split('/') if p]
+            try:
+                pk = int(parts[0]) if parts else None
+            except ValueError:
+                return None, None, None
+            extra = parts[1] if len(parts) > 1 else None
+            return endpoint, pk, extra
+        return None, None, None
+
+    def dispatch(self, method, endpoint, pk, extra, query, data):
+        items = self.data[endpoint]
+
+        with self.lock:
+            if pk is None:
+                if method == 'post':
+                    pk = max(items or [0]) + 1
+                    items[pk] = dict(data, id=pk)
+                    return 201, items[pk]
+                return 200, self.paginate(endpoint, query)
+
+            if pk not in items:
+                return 404, {'detail': 'Not found.'}
+            item = items[pk]
+
+            if extra == 'code':
+                return 200, {'msg': '{:06d}'.format(pk % 1000000)}
+            if extra in ACTIONS:
+                item[ACTIONS[extra]] = time.time()
+            if extra:
+                return 200, {'msg': 'ok'}
+            if method == 'delete':
+                del items[pk]
+                return 204, {}
+            if method in ('patch', 'put'):
+                item.update(data)
+            return 200, item
+
+    def paginate(self, endpoint, query):
+        items = list(self.data[endpoint].values())
+        try:
+            limit = int(query.get('limit', PAGE_SIZE))
+            offset = int(query.get('offset', 0))
+        except ValueError:
+            limit, offset = PAGE_SIZE, 0
+
+        url = self.get_url() + endpoint
+
+        def page_url(value):
+            if value < 0 or value >= len(items):
+                return None
+            return '{}?{}'.format(
+                url, urlencode(dict(query, limit=limit, offset=value))
+            )
+
+        previous = page_url(max(offset - limit, 0)) if offset else None
+        return {
+            'count': len(items),
+            'next': page_url(offset + limit),
+            'previous': previous,
+            'results': items[offset:offset + limit],
+        }
+
+    def start(self):
+        self.thread = threading.Thread(target=self.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
@@ -0,0 +1,157 @@
+from html import escape
+import re
+
+
+STEP = re.compile(r'^([\w-]+)(?:\[(\d+)\])?$')
+
+ID_ROOT = re.compile(r'^//\*\[@id="([^"]+)"\]')
+
+VOID_TAGS = ('input', 'img', 'meta', 'br')
+
+STYLE = '''
+body *:not(table):not(tbody):not(tr):not(td):not(template) {
+    display: block;
+    min-height: 8px;
+    min-width: 8px;
+    margin: 1px;
+}
+input, textarea { width: 240px; }
+'''
+
+SCRIPT = '''
+document.addEventListener('click', function (event) {
+    var checkbox = event.target.closest('[aria-checked]');
+    if (checkbox) {
+        var checked = checkbox.getAttribute('aria-checked') === 'true';
+        checkbox.setAttribute('aria-checked', checked ? 'false' : 'true');
+    }
+
+    var option = event.target.closest('[role="option"]');
+    if (option) {
+        var field = option.parentNode;
+        while (field && !field.querySelector('input')) {
+            field = field.parentNode;
+        }
+        var inputs = field ? field.querySelectorAll('input') : [];
+        if (inputs.length) {
+            inputs[inputs.length - 1].value = option.textContent;
+        }
+    }
+
+    var section = event.target.closest('[data-dialog]');
+    if (section) {
+        var template = document.getElementById(section.dataset.dialog);
+        var target = document.evaluate(
+            section.dataset.target, document, null,
+            XPathResult.FIRST_ORDERED_NODE_TYPE, null
+        ).singleNodeValue;
+        target.innerHTML = template.innerHTML;
+    }
+});
+'''
+
+
+class Element:
+    def __init__(self, tag, attrs=None, text=''):
+        self.tag = tag
+        self.attrs = dict(attrs or {})
+        self.text = text
+        self.children = []
+
+    def child(self, tag, index=1):
+        same = [c for c in self.children if c.tag == tag]
+        while len(same) < index:
+            element = Element(tag)
+            self.children.append(element)
+            same.append(element)
+        return same[index - 1]
+
+    def render(self):
+        attrs = ''.join(
+            ' {}="{}"'.format(k, escape(str(v)))
+            for k, v in self.attrs.items()
+        )
+        if self.tag in VOID_TAGS:
+            return '<{}{}>'.format(self.tag, attrs)
+        return '<{tag}{attrs}>{text}{children}</{tag}>'.format(
+            tag=self.tag,
+            attrs=attrs,
+            text=escape(self.text),
+            children=self.inner_html(),
+        )
+
+    def inner_html(self):
+        return ''.join(child.render() for child in self.children)
+
+
+class Fragment:
+    def __init__(self, tag='div'):
+        self.root = Element(tag)
+        self.ids = {}
+
+    def add(self, xpath, text=None, attrs=None):
+        node = self.resolve(xpath)
+        node.attrs.update(attrs or {})
+        if 'id' in node.attrs:
+            self.ids[node.attrs['id']] = node
+        if text is not None:
+            node.text = text
+        return node
+
+    def get_root(self, xpath):
+        match = ID_ROOT.match(xpath)
+        if match:
+            id_ = match.group(1)
+            if id_ not in self.ids:
+                self.ids[id_] = Element('div', {'id': id_})
+                self.root.children.append(self.ids[id_])
+            return self.ids[id_], xpath[match.end():]
+        return self.root, xpath
+
+    def resolve(self, xpath):
+        node, path = self.get_root(xpath)
+        for step in path.strip('/').split('/'):
+            if not step:
+                continue
+            match = STEP.match(step)
+            assert match, "Unsupported step: %s" % step
+            tag, index = match.groups()
+            node = node.child(tag, int(index or 1))
+        return node
+
+
+class Page(Fragment):
+    def __init__(self, title=''):
+        super().__init__(tag='body')
+        self.title = title
+        self.templates = {}
+
+    def get_root(self, xpath):
+        if xpath.startswith('/html/body'):
+            return self.root, xpath[len('/html/body'):]
+        return super().get_root(xpath)
+
+    def add_dialog(self, trigger, target, fragment):
+        name = 'dialog-{}'.format(len(self.templates) + 1)
+        self.templates[name] = fragment
+        self.add(trigger, attrs={'data-dialog': name, 'data-target': target})
+        self.resolve(target)
+
+    def render(self):
+        templates = ''.join(
+            '<template id="{}">{}</template>'.format(
+                name, fragment.root.inner_html()
+            )
+            for name, fragment in self.templates.items()
+        )
+        return (
+            '<!DOCTYPE html><html><head><title>{title}</title>'
+            '<style>{style}</style>{templates}</head>{body}'
+            '<script>{script}</script></html>'
+        ).format(
+            title=escape(self.title),
+            style=STYLE,
+            templates=templates,
+            body=self.root.render(),
+            script=SCRIPT,
+        )
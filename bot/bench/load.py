@@ -0,0 +1,175 @@
+from concurrent.futures import ThreadPoolExecutor
+import itertools
+import random
+import threading
+import time
+
+from .. import config
+from ..base.retry import RetryPolicy
+from ..flow.service import CodeService, GMBService, LeadService
+from ..postcard.service import Postcard, PostcardService
+from ..renamer.service import Business, BusinessService
+from ..uploader.service import CredentialService
+from .api import APIServer
+from .pages import BUSINESS
+
+
+SERVICES = {
+    'business': BusinessService,
+    'code': CodeService,
+    'credential': CredentialService,
+    'gmb': GMBService,
+    'lead': LeadService,
+    'postcard': PostcardService,
+}
+
+OPERATIONS = (
+    ('renamer.list', lambda s, pk: s['business'].get_list()),
+    ('renamer.detail', lambda s, pk: s['business'].get_detail(pk)),
+    ('renamer.code', lambda s, pk: Business(s['business'], {'id': pk})
+     .get_code(phone_number=BUSINESS['final_phone_number'])),
+    ('renamer.set-success', lambda s, pk: Business(
+        s['business'], {'id': pk, 'date_success': None}
+    ).report_success(google_maps='', google_search='')),
+    ('renamer.set-fail', lambda s, pk: Business(
+        s['business'], {'id': pk, 'date_fail': None}
+    ).report_fail()),
+    ('postcard.list', lambda s, pk: s['postcard'].get_list()),
+    ('postcard.patch', lambda s, pk: Postcard(s['postcard'], {'id': pk})
+     .patch(status='creating')),
+    ('uploader.list', lambda s, pk: s['credential'].get_list()),
+    ('flow.codes', lambda s, pk: s['code'].get_list(
+        limit=1, has_code=3, status='null', user='null'
+    )),
+    ('flow.gmbs', lambda s, pk: s['gmb'].get_list(
+        is_created=3, limit=config.INSTANCES, account__is_active=2
+    )),
+    ('flow.lead', lambda s, pk: s['lead'].get_detail(pk)),
+)
+
+
+def percentile(values, p):
+    if not values:
+        return 0
+    values = sorted(values)
+    return values[int(round(p * (len(values) - 1)))]
+
+
+class LoadGenerator:
+    def __init__(self, workers=4, requests=1000, size=100):
+        self.workers = workers
+        self.requests = requests
+        self.size = size
+        self.counter = itertools.count()
+        names = ['login'] + [name for name, operation in OPERATIONS]
+        self.latencies = {name: [] for name in names}
+        self.errors = {name: 0 for name in names}
+        self.lock = threading.Lock()
+
+    def __call__(self):
+        start = time.time()
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            list(executor.map(self.worker, range(self.workers)))
+        return self.get_report(time.time() - start)
+
+    def worker(self, index):
+        services = {name: cls() for name, cls in SERVICES.items()}
+        for service in services.values():
+            if not self.login(service):
+                print('Worker {}: {} login failed, stopping.'.format(
+                    index, service.__class__.__name__
+                ))
+                return
+
+        while next(self.counter) < self.requests:
+            name, operation = random.choice(OPERATIONS)
+            pk = random.randint(1, self.size)
+            start = time.time()
+            try:
+                operation(services, pk)
+            except Exception:
+                with self.lock:
+                    self.errors[name] += 1
+                continue
+            self.latencies[name].append(time.time() - start)
+
+    def login(self, service):
+        policy = RetryPolicy()
+        retry = 0
+        while True:
+            start = time.time()
+            try:
+                service.authenticate()
+            except Exception:
+                with self.lock:
+                    self.errors['login'] += 1
+                retry += 1
+                delay = policy.get_delay(retry)
+                if not policy.should_retry(retry, delay, None):
+                    return False
+                time.sleep(delay)
+                continue
+            self.latencies['login'].append(time.time() - start)
+            return True
+
+    def get_report(self, seconds):
+        # Logins are reported on their own row, outside the totals.
+        names = [name for name, operation in OPERATIONS]
+        latencies = list(itertools.chain(
+            *(self.latencies[name] for name in names)
+        ))
+        errors = sum(self.errors[name] for name in names)
+        rows = [
+            (name, len(values), self.errors[name], values)
+            for name, values in self.latencies.items()
+        ]
+        rows.append(('total', len(latencies), errors, latencies))
+
+        return {
+            'seconds': seconds,
+            'requests_per_second': (len(latencies) + errors) / seconds,
+            'operations': [
+                {
+                    'name': name,
+                    'requests': count,
+                    'errors': errors,
+                    'p50': percentile(values, 0.5),
+                    'p99': percentile(values, 0.99),
+                }
+                for name, count, errors, values in rows
+            ],
+        }
+
+
+def run(*args, **kwargs):
+    workers = int(kwargs.get('--workers', config.WORKERS))
+    requests = int(kwargs.get('--requests', 1000))
+    size = int(kwargs.get('--size', 100))
+
+    server = APIServer(
+        port=int(kwargs.get('--port', 0)),
+        size=size,
+        latency=float(kwargs.get('--latency', 0)),
+        error_rate=float(kwargs.get('--errors', 0)),
+    )
+    api_root = config.API_ROOT
+
+    with server:
+        config.API_ROOT = server.get_url()
+        try:
+            report = LoadGenerator(workers, requests, size)()
+        finally:
+            config.API_ROOT = api_root
+
+    print('{} workers, {:.1f}s, {:.1f} requests/s'.format(
+        workers, report['seconds'], report['requests_per_second']
+    ))
+    for operation in report['operations']:
+        print(
+            '  {name:<22} {requests:6d} ok {errors:5d} errors  '
+            'p50 {p50_ms:7.1f}ms  p99 {p99_ms:7.1f}ms'.format(
+                p50_ms=operation['p50'] * 1000,
+                p99_ms=operation['p99'] * 1000,
+                **operation
+            )
+        )
@@ -0,0 +1,394 @@
+from .html import Fragment, Page
+
+
+BUSINESS = {
+    'id': 1001,
+    'name': 'Acme Plumbing',
+    'final_name': 'Acme Plumbing Austin',
+    'final_category_1': 'Plumber',
+    'final_address': '100 Congress Ave',
+    'final_city': 'Austin',
+    'final_state': 'TX',
+    'final_zip_code': '78701',
+    'final_phone_number': '5125550100',
+    'final_website': 'https://example.com',
+    'final_description': 'Family owned plumbing company. ' * 24,
+    'username': 'bench@example.com',
+    'password': 'bench',
+    'email': 'bench@example.com',
+    'recovery_email': 'recovery@example.com',
+}
+
+PHONE = '(512) 555-0100'
+
+
+def dialog(prefix, specs):
+    fragment = Fragment()
+    for spec in specs:
+        xpath, text, attrs = (tuple(spec) + (None, None))[:3]
+        if xpath.startswith(prefix):
+            xpath = xpath[len(prefix):]
+        fragment.add(xpath, text=text, attrs=attrs)
+    return fragment
+
+
+def add_all(page, specs):
+    for spec in specs:
+        xpath, text, attrs = (tuple(spec) + (None, None))[:3]
+        page.add(xpath, text=text, attrs=attrs)
+    return page
+
+
+def signin_page(step, continue_):
+    page = Page('Sign in')
+    page.add('/html/body/form', attrs={'method': 'get'})
+    if step == 'identifier':
+        page.add('/html/body/form/input[1]', attrs={
+            'id': 'identifierId', 'name': 'identifier', 'type': 'text'
+        })
+    else:
+        page.add('/html/body/form/input[1]', attrs={
+            'name': 'password', 'type': 'password'
+        })
+    page.add('/html/body/form/input[2]', attrs={
+        'name': 'continue', 'type': 'hidden', 'value': continue_
+    })
+    page.add('/html/body/form/input[3]', attrs={
+        'name': 'step', 'type': 'hidden', 'value': step
+    })
+    return page
+
+
+def verify_page(base, text):
+    pane = '//*[@id="main_viewpane"]/c-wiz[1]/div/div[2]/div/div'
+    return add_all(Page('Verify'), [
+        ('/html/body/p', text),
+        (pane + '/div/div[1]/div/div[1]/h3', PHONE),
+        (pane + '/div/div[1]/div/div[2]/button[2]', 'Call'),
+        (pane + '/div[1]/div[2]/div[1]/div/div[1]/input',),
+        (pane + '/div[1]/div[3]/button', 'Verify'),
+        (pane + '/div[3]/button', 'Get started'),
+        ('//*[@id="dcrd-8"]/div/ul/li[1]/a', 'Maps', {
+            'href': base + '/maps/1001'
+        }),
+        ('//*[@id="dcrd-8"]/div/ul/li[2]/a', 'Search', {
+            'href': base + '/search/1001'
+        }),
+    ])
+
+
+# Renamer
+
+RENAMER_ROW = (
+    '/html/body/div[4]/c-wiz/div[2]/div[1]/c-wiz/div/c-wiz[3]/div/content/'
+    'c-wiz[2]/div[2]/table/tbody/tr[1]'
+)
+
+RENAMER_SECTION = (
+    '//*[@id="main_viewpane"]/c-wiz[1]/div/div[1]/div[2]/content/div[{}]'
+)
+
+RENAMER_DIALOG = '//*[@id="js"]/div[10]'
+
+# What a fresh listing shows before the renamer has edited it.
+RENAMER_VALUES = {
+    2: BUSINESS['name'],
+    3: 'Add category',
+    5: 'Add service area',
+    6: 'Add hours',
+    7: 'Add special hours',
+    9: 'Add website',
+    10: 'Add attributes',
+    11: 'Add description',
+    12: 'Add opening date',
+}
+
+
+def renamer_dialog_specs(d):
+    d += '/div/div[2]/content/div'
+    address = d + '/div[4]/div/div[3]/div[1]/div/div/div[2]/div/div'
+    year = d + '/div[4]/div[1]/span[1]/div/div[1]/div/div[1]/input'
+    month = d + '/div[4]/div[1]/span[2]/span/div'
+    day = d + '/div[4]/div[1]/span[3]/div'
+    hours = []
+    for row in range(1, 8):
+        r = '{}/div[3]/div/div[{}]'.format(d, row)
+        hours += [
+            (r + '/label/div', None, {'aria-checked': 'false'}),
+            (r + '/div[2]/div[1]/div/div[1]/div[1]/input[2]',),
+            (r + '/div[2]/div[1]/div/div[1]/div[2]/div/div/div[1]', '24h',
+             {'role': 'option'}),
+        ]
+
+    return {
+        3: [
+            (d + '/div[4]/div/div[1]/div/div[1]/div[1]/input[2]',),
+            (d + '/div[4]/div/div[1]/div/div[1]/div[2]/div/div/div[1]',
+             'Plumber'),
+            (d + '/div[5]/div[2]', 'Apply'),
+        ],
+        4: [
+            (d + '/div[4]/div/div[3]/div[4]/div', 'Edit address'),
+            (address + '/div[2]/input',),
+            (address + '/div[4]/input',),
+            (address + '/div[5]/div[2]', 'State'),
+            (address + '/div[5]/div[3]/div[1]', 'California'),
+            (address + '/div[5]/div[3]/div[2]', 'Texas'),
+            (address + '/div[6]/input',),
+            (d + '/div[5]/div[2]', 'Apply'),
+        ],
+        5: [
+            (d + '/div[4]/div/div[1]/div/div/div/div/div/div/div[1]/div[2]/'
+             'div[1]/div/div[1]/input',),
+            (d + '/div[4]/div/div[1]/div/div/div/div/div/div/div[2]/div/div/'
+             'div[1]', 'Austin, TX'),
+            (d + '/div[5]/div[2]', 'Apply'),
+        ],
+        6: hours + [(d + '/div[4]/div[2]', 'Apply')],
+        7: [
+            (d + '/div[4]/div[2]/div[1]/span[1]/div', 'Closed'),
+            (d + '/div[4]/div[2]/div[3]/span[1]/div', 'Closed'),
+            (d + '/div[5]/div[2]', 'Apply'),
+        ],
+        8: [
+            (d + '/div[3]/div[1]/div/div/div[2]/div[1]/div/div[1]/input',
+             None, {'value': PHONE}),
+            (d + '/div[3]/div[3]/div[1]/div[1]/div/div[2]/div[1]/div/div[1]/'
+             'input',),
+            (d + '/div[4]/div[2]', 'Apply'),
+        ],
+        9: [
+            (d + '/div[4]/div[1]/div[1]/div/div[1]/input',),
+            (d + '/div[5]/div[2]', 'Apply'),
+        ],
+        10: [
+            (d + '/div[4]/div', None, {'id': 'attr-dialog-content'}),
+        ] + [
+            ('//*[@id="attr-dialog-content"]/div[{}]'.format(i),
+             'Attribute {}'.format(i), {'aria-checked': 'false'})
+            for i in range(1, 11)
+        ] + [
+            (d + '/div[5]/div[2]', 'Apply'),
+        ],
+        11: [
+            (d + '/div[4]/div/div[1]/div[1]/textarea',),
+            (d + '/div[5]/div[2]', 'Apply'),
+        ],
+        12: [
+            (year,),
+            (month, 'Month'),
+        ] + [
+            ('{}/div[2]/div[{}]'.format(month, i), str(i - 2))
+            for i in range(3, 15)
+        ] + [
+            (day, 'Day'),
+        ] + [
+            ('{}/div[2]/div[{}]'.format(day, i), str(i - 2))
+            for i in range(3, 34)
+        ] + [
+            (d + '/div[5]/div[2]', 'Apply'),
+        ],
+    }
+
+
+def renamer_pages(base):
+    locations = add_all(Page('Locations'), [
+        (RENAMER_ROW + '/td[1]', ''),
+        (RENAMER_ROW + '/td[2]/content/a', BUSINESS['name'], {
+            'href': base + '/dashboard/l/1001'
+        }),
+        (RENAMER_ROW + '/td[3]', 'Verification required'),
+        (RENAMER_ROW + '/td[4]/content/div/div/a', 'Verify now', {
+            'href': base + '/verify/l/1001', 'target': '_blank'
+        }),
+    ])
+
+    edit = Page('Edit')
+    name = '//*[@id="js"]/div[9]'
+    edit.add_dialog(RENAMER_SECTION.format(2), name, dialog(name, [
+        (name + '/div/div[2]/content/div/div[4]/div/div[1]/div/div[1]/input',),
+        (name + '/div/div[2]/content/div/div[5]/div[2]', 'Apply'),
+    ]))
+    for section, specs in renamer_dialog_specs(RENAMER_DIALOG).items():
+        edit.add_dialog(
+            RENAMER_SECTION.format(section),
+            RENAMER_DIALOG,
+            dialog(RENAMER_DIALOG, specs)
+        )
+    for section in range(2, 13):
+        edit.add(
+            RENAMER_SECTION.format(section),
+            RENAMER_VALUES.get(section, 'Section {}'.format(section))
+        )
+
+    return {
+        'locations': locations,
+        'dashboard': Page('Dashboard'),
+        'edit': edit,
+        'verify': verify_page(base, 'Enter the code'),
+    }
+
+
+# Uploader
+
+UPLOADER_TABLE = (
+    '//*[@id="yDmH0d"]/c-wiz/div[2]/div[1]/c-wiz/div/c-wiz[3]/div/content/'
+    'c-wiz[2]'
+)
+
+
+def uploader_pages(base, rows=3):
+    specs = [
+        (UPLOADER_TABLE + '/div[4]/div/span[1]/div[2]', 'Rows'),
+        (UPLOADER_TABLE + '/div[4]/div/span[1]/div[2]/div[2]/div[4]', '100'),
+    ]
+    for row in range(1, rows + 1):
+        r = '{}/div[2]/table/tbody/tr[{}]'.format(UPLOADER_TABLE, row)
+        specs += [
+            (r + '/td[1]', ''),
+            (r + '/td[2]', str(1000 + row)),
+            (r + '/td[3]/div[1]', '{} {}'.format(BUSINESS['name'], row)),
+            (r + '/td[3]/div[2]', '{} Congress Ave, Austin, TX 78701'.format(
+                100 + row
+            )),
+            (r + '/td[4]', 'Verification required'),
+            (r + '/td[5]/content/div/div/a', 'Verify now', {
+                'href': '{}/verify/l/{}'.format(base, 1000 + row),
+                'target': '_blank',
+            }),
+        ]
+
+    return {
+        'locations': add_all(Page('Locations'), specs),
+        'verify': verify_page(base, 'Enter the code'),
+    }
+
+
+# Flow
+
+FLOW_SECTION = (
+    '//*[@id="yDmH0d"]/c-wiz/div[2]/div[1]/c-wiz/div/div[2]/div[2]/span/'
+    'div[{}]'
+)
+
+FLOW_DIALOG = '//*[@id="yDmH0d"]/div[4]'
+
+
+def flow_pages(base):
+    row = (
+        '//*[@id="yDmH0d"]/c-wiz/div[2]/div[1]/c-wiz/div/c-wiz[3]/div/span/'
+        'c-wiz[2]/div[2]/table/tbody/tr[1]'
+    )
+    locations = add_all(Page('Locations'), [
+        (row + '/td[1]', ''),
+        (row + '/td[2]/span/a', BUSINESS['name'], {
+            'href': base + '/dashboard/l/1001'
+        }),
+    ])
+
+    s = FLOW_DIALOG + '/div/div[2]/span/section'
+    hours = []
+    for i in range(1, 8):
+        r = '{}/div[3]/div/div[{}]'.format(s, i)
+        hours += [
+            (r + '/label/div', None, {'aria-checked': 'false'}),
+            (r + '/div[2]/div[1]/div/div[1]/div[1]/input[2]',),
+            (r + '/div[2]/div[1]/div/div[1]/div[2]/div/div/div[1]', '24h',
+             {'role': 'option'}),
+        ]
+
+    edit = Page('Edit')
+    dialogs = {
+        2: [
+            (s + '/div[4]/div/div[1]/div/div[1]/input',),
+            (s + '/div[5]/span[2]/div', 'Apply'),
+        ],
+        3: [
+            (s + '/div[4]/div/div[1]/div/div[1]/div[1]/input[2]',),
+            (s + '/div[4]/div/div[1]/div/div[1]/div[2]/div/div/div[1]',
+             'Plumber'),
+            (s + '/div[5]/span[2]/div', 'Apply'),
+        ],
+        6: hours + [(s + '/div[4]/span[2]/div', 'Apply')],
+        8: [
+            (s + '/div[3]/div[1]/div/div/div[2]/div[1]/div/div[1]/input',),
+            (s + '/div[4]/span[2]/div', 'Apply'),
+        ],
+    }
+    for section, specs in dialogs.items():
+        edit.add_dialog(
+            FLOW_SECTION.format(section),
+            FLOW_DIALOG,
+            dialog(FLOW_DIALOG, specs)
+        )
+    edit.add(FLOW_SECTION.format(2), BUSINESS['name'])
+
+    pane = '//*[@id="yDmH0d"]/c-wiz/c-wiz/div/div/div[2]/div/div'
+    verify = add_all(Page('Verify'), [
+        (pane + '/div/div[1]/div/div[2]/button[2]', 'Call'),
+        (pane + '/div[1]/div[2]/div[1]/div/div[1]/input',),
+        (pane + '/div[1]/div[3]/button', 'Verify'),
+    ])
+
+    return {
+        'locations': locations,
+        'dashboard': Page('Dashboard'),
+        'edit': edit,
+        'verify': verify,
+    }
+
+
+# Postcard
+
+POSTCARD_WIZARD = '//*[@id="yDmH0d"]/c-wiz/c-wiz/div/div[1]'
+
+
+def postcard_pages(base):
+    w = POSTCARD_WIZARD
+    address = w + '/div[2]/div/div/div[1]/div/div/c-wiz/c-wiz/div/div'
+    create = add_all(Page('Create'), [
+        (w + '/div[2]/div/div[4]/div', 'Add your business'),
+        (w + '/div[2]/div/div/div/div/div/div[1]/div[2]/div[1]/div/div[1]/'
+         'input',),
+        (w + '/div[2]/div/div/div/div/div/div[2]/div/div', 'Plumber'),
+        (w + '/div[2]/div/div[1]/div/span/label[1]', 'Yes'),
+        (w + '/div[2]/div/div[1]/div/span/label[2]', 'No'),
+        (address + '/div[1]/div[1]/div[2]/div[1]', 'Canada', {
+            'data-value': 'CA'
+        }),
+        (address + '/div[1]/div[1]/div[2]/div[2]', 'United States', {
+            'data-value': 'US'
+        }),
+        (address + '/div[6]/div[1]/div[2]/div[1]', 'California', {
+            'data-value': 'CA'
+        }),
+        (address + '/div[6]/div[1]/div[2]/div[2]', 'Texas', {
+            'data-value': 'TX'
+        }),
+        (w + '/div[2]/div/div/div/div/div/div/div[1]/div[2]/div[1]/div/'
+         'div[1]/input',),
+        (w + '/div[2]/div/div/div/div/div/div/div[3]/div/div/div[1]',
+         'Austin, TX'),
+        (w + '/div[2]/div/form/div[1]/div/div/div/div/div[2]/div[1]/div/'
+         'div[1]/input',),
+        (w + '/div[2]/div/form/div[2]/div/span/div[2]/div', 'No website'),
+        (w + '/div[3]/div[1]', 'Next'),
+        ('//*[@id="fields"]/div[1]', 'Country / Region', {
+            'aria-label': 'Country / Region'
+        }),
+        ('//*[@id="fields"]/div[2]', 'State', {'aria-label': 'State'}),
+        ('//*[@id="fields"]/input[1]', None, {'aria-label': 'ZIP code'}),
+        ('//*[@id="fields"]/input[2]', None, {'aria-label': 'City'}),
+        ('//*[@id="fields"]/input[3]', None, {
+            'aria-label': 'Street address'
+        }),
+    ])
+    return {'create': create}
+
+
+PAGES = {
+    'flow': flow_pages,
+    'postcard': postcard_pages,
+    'renamer': renamer_pages,
+    'uploader': uploader_pages,
+}
@@ -0,0 +1,56 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from .. import config
+from .scenarios import SCENARIOS, run_job
+from .server import BenchServer
+
+
+def report(bot, results):
+    steps = {}
+    for result in results:
+        for name, seconds in result['steps']:
+            steps.setdefault(name, []).append(seconds)
+
+    print('== {} ({} jobs)'.format(bot, len(results)))
+    for name, seconds in steps.items():
+        print('  {:<28} mean {:7.2f}s  max {:7.2f}s'.format(
+            name, sum(seconds) / len(seconds), max(seconds)
+        ))
+
+    totals = [result['total'] for result in results]
+    print('  {:<28} mean {:7.2f}s  max {:7.2f}s'.format(
+        'job', sum(totals) / len(totals), max(totals)
+    ))
+    for name in ('sleep', 'webdriver', 'retry'):
+        seconds = [result['totals'][name] for result in results]
+        print('  {:<28} mean {:7.2f}s  max {:7.2f}s'.format(
+            name, sum(seconds) / len(seconds), max(seconds)
+        ))
+    for result in results:
+        if result['error']:
+            print('  FAILED {}'.format(result['error']))
+
+
+def run(*args, **kwargs):
+    bots = kwargs.get('--bots')
+    bots = bots.split(',') if bots else sorted(SCENARIOS)
+    jobs = int(kwargs.get('--jobs', 1))
+    fast = bool(kwargs.get('--fast', False))
+
+    server = BenchServer(
+        port=int(kwargs.get('--port', 0)),
+        snapshots=kwargs.get('--snapshots'),
+        latency=float(kwargs.get('--latency', 0)),
+    )
+    gbm_url = config.GBM_URL
+
+    with server:
+        for bot in bots:
+            config.GBM_URL = server.get_url(bot)
+            with ThreadPoolExecutor(max_workers=jobs) as executor:
+                results = list(executor.map(
+                    lambda i: run_job(bot, fast=fast), range(jobs)
+                ))
+            report(bot, results)
+
+    config.GBM_URL = gbm_url
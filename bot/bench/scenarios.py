@@ -0,0 +1,175 @@
+import time
+import traceback
+
+from .. import config
+from ..base.selenium import BaseSelenium
+from ..base.service import BaseEntity, BaseService
+from ..flow.selenium import FlowSelenium
+from ..postcard.selenium import PostcardSelenium
+from ..postcard.service import Postcard
+from ..renamer.selenium import RenamerSelenium
+from ..renamer.service import Business
+from ..uploader.selenium import UploaderSelenium
+from .pages import BUSINESS
+
+
+class BenchService(BaseService):
+    def get_detail(self, pk):
+        return self.entity(self, {'id': pk, 'status': 'not-created'})
+
+    def request(self, method, endpoint=None, pk=None, extra=None, **kwargs):
+        return {'msg': '123456'}
+
+
+def build(cls, **attrs):
+    # The bots run `handle` from their constructors, skip it to time the
+    # steps one by one.
+    selenium = cls.__new__(cls)
+    BaseSelenium.__init__(selenium)
+    selenium.__dict__.update(attrs)
+    return selenium
+
+
+def close_tab(selenium):
+    selenium.driver.close()
+    selenium.driver.switch_to.window(selenium.driver.window_handles[0])
+
+
+def renamer_scenario():
+    entity = Business(BenchService(), dict(BUSINESS))
+    selenium = build(RenamerSelenium, entity=entity, listing=None)
+    return selenium, [
+        ('login', lambda s: s.do_login(entity), False),
+        ('open_verification_tab', RenamerSelenium.do_open_verification_tab,
+         False),
+        ('go_to_edit', RenamerSelenium.go_to_edit, False),
+        ('changes', RenamerSelenium.get_changes, False),
+        ('final_name', RenamerSelenium.do_final_name, False),
+        ('final_category_1', RenamerSelenium.do_final_category_1, False),
+        ('service_area', RenamerSelenium.do_service_area, False),
+        ('hours', RenamerSelenium.do_hours, False),
+        ('special_hours', RenamerSelenium.do_special_hours, False),
+        ('website', RenamerSelenium.do_website, False),
+        ('attributes', RenamerSelenium.do_attributes, False),
+        ('description', RenamerSelenium.do_description, False),
+        ('opening_date', RenamerSelenium.do_opening_date, False),
+        ('code_fill', RenamerSelenium.do_code_fill, False),
+        ('address', RenamerSelenium.do_address, False),
+        ('phone', RenamerSelenium.do_phone, False),
+        ('close_tab', close_tab, False),
+        ('code_send', RenamerSelenium.do_code_send, True),
+        ('final_data', RenamerSelenium.get_final_data, False),
+    ]
+
+
+def uploader_scenario():
+    service = BenchService()
+    entity = BaseEntity(service, dict(BUSINESS))
+    selenium = build(
+        UploaderSelenium, entity=entity, writer=None, biz_service=service
+    )
+    return selenium, [
+        ('login', lambda s: s.do_login(entity), False),
+        ('go_to_manager', UploaderSelenium.go_to_manager, False),
+        ('pagination', UploaderSelenium.do_pagination, False),
+        ('verify_rows', UploaderSelenium.verify_rows, False),
+        ('verify_tabs', UploaderSelenium.verify_tabs, False),
+        ('report_success', UploaderSelenium.report_success, False),
+    ]
+
+
+def flow_scenario():
+    service = BenchService()
+    entity = BaseEntity(service, dict(BUSINESS))
+    selenium = build(
+        FlowSelenium, entity=entity, credential=entity, code=None, lead=None
+    )
+    return selenium, [
+        ('login', lambda s: s.do_login(entity), False),
+        ('go_to_created_business', FlowSelenium.go_to_created_business,
+         False),
+        ('get_name', FlowSelenium.get_name, False),
+        ('hours', FlowSelenium.do_hours, False),
+        ('open_verification_tab', FlowSelenium.open_verification_tab, False),
+        ('has_number_verification', FlowSelenium.has_number_verification,
+         False),
+    ]
+
+
+def postcard_scenario():
+    postcard = Postcard(BenchService(), {
+        'id': BUSINESS['id'],
+        'name': BUSINESS['name'],
+        'recipient': None,
+        'account': {
+            'username': BUSINESS['username'],
+            'password': BUSINESS['password'],
+        },
+        'country': {'code': 'US'},
+        'state': BUSINESS['final_state'],
+        'city': BUSINESS['final_city'],
+        'zip_code': BUSINESS['final_zip_code'],
+        'address': BUSINESS['final_address'],
+        'category': BUSINESS['final_category_1'],
+        'phone': BUSINESS['final_phone_number'],
+        'status': 'creating',
+    })
+    selenium = build(PostcardSelenium, postcard=postcard)
+    return selenium, [
+        ('login', lambda s: s.do_login(
+            postcard.account, url=config.GBM_URL + '/create'
+        ), False),
+        ('name', PostcardSelenium.do_name, False),
+        ('can_visit', PostcardSelenium.do_can_visit, False),
+        ('address_country', PostcardSelenium.do_address_country, False),
+        ('address_state', PostcardSelenium.do_address_state, False),
+        ('address_zip_code', PostcardSelenium.do_address_zip_code, False),
+        ('address_city', PostcardSelenium.do_address_city, False),
+        ('address_street', PostcardSelenium.do_address_street, False),
+        ('map', PostcardSelenium.do_map, False),
+        ('service_area', PostcardSelenium.do_service_area, False),
+        ('category', PostcardSelenium.do_category, False),
+        ('phone', PostcardSelenium.do_phone, False),
+        ('finish', PostcardSelenium.do_finish, False),
+    ]
+
+
+SCENARIOS = {
+    'flow': flow_scenario,
+    'postcard': postcard_scenario,
+    'renamer': renamer_scenario,
+    'uploader': uploader_scenario,
+}
+
+
+def run_job(bot, fast=False):
+    selenium, steps = SCENARIOS[bot]()
+    if fast:
+        selenium._wait = lambda seconds, site=None: None
+
+    timings = []
+    current = 'setup'
+    error = None
+    start = time.time()
+
+    try:
+        selenium.driver = selenium.get_driver(size=(1200, 700))
+        for current, step, slow in steps:
+            if slow and fast:
+                continue
+            step_start = time.time()
+            step(selenium)
+            timings.append((current, time.time() - step_start))
+    except Exception as err:
+        error = '{}: {!r}'.format(current, err)
+        selenium.logger(data=traceback.format_exc())
+    finally:
+        selenium.quit_driver()
+
+    return {
+        'bot': bot,
+        'steps': timings,
+        'totals': selenium.timings.get_totals(),
+        'total': time.time() - start,
+        'error': error,
+    }
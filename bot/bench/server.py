@@ -0,0 +1,116 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import os
+import threading
+import time
+from urllib.parse import parse_qs, urlencode, urlparse
+
+from .pages import PAGES, signin_page
+
+
+COOKIE = 'bench_session'
+
+
+class BenchHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        if self.server.latency:
+            time.sleep(self.server.latency)
+
+        url = urlparse(self.path)
+        parts = [part for part in url.path.split('/') if part]
+        if len(parts) < 2 or parts[0] not in self.server.pages:
+            return self.send_html('Not found', status=404)
+
+        bot, page = parts[0], parts[1]
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+
+        if page == 'signin':
+            return self.do_signin(bot, query)
+
+        if '{}={}'.format(COOKIE, bot) not in self.headers.get('Cookie', ''):
+            return self.redirect('/{}/signin?{}'.format(
+                bot, urlencode({'continue': url.path})
+            ))
+
+        content = self.server.get_page(bot, page)
+        if content is None:
+            return self.send_html('Not found', status=404)
+        self.send_html(content)
+
+    def do_signin(self, bot, query):
+        continue_ = query.get('continue', '/{}/locations'.format(bot))
+        step = query.get('step')
+
+        if step == 'identifier' and query.get('identifier'):
+            page = signin_page('password', continue_)
+            return self.send_html(page.render())
+
+        if step == 'password' and query.get('password'):
+            return self.redirect(continue_, cookie='{}={}; Path=/{}'.format(
+                COOKIE, bot, bot
+            ))
+
+        self.send_html(signin_page('identifier', continue_).render())
+
+    def redirect(self, location, cookie=None):
+        self.send_response(302)
+        self.send_header('Location', location)
+        if cookie:
+            self.send_header('Set-Cookie', cookie)
+        self.end_headers()
+
+    def send_html(self, content, status=200):
+        content = content.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+
+class BenchServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, host='127.0.0.1', port=0, snapshots=None, latency=0):
+        super().__init__((host, port), BenchHandler)
+        self.snapshots = snapshots
+        self.latency = latency
+        self.thread = None
+
+        self.pages = {}
+        for bot, get_pages in PAGES.items():
+            self.pages[bot] = {
+                name: page.render()
+                for name, page in get_pages(self.get_url(bot)).items()
+            }
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def get_page(self, bot, page):
+        if self.snapshots:
+            path = os.path.join(self.snapshots, bot, '{}.html'.format(page))
+            if os.path.exists(path):
+                with open(path, 'r') as f:
+                    return f.read()
+        return self.pages[bot].get(page)
+
+    def get_url(self, bot=None):
+        host, port = self.server_address[:2]
+        url = 'http://{}:{}'.format(host, port)
+        return '{}/{}'.format(url, bot) if bot else url
+
+    def start(self):
+        self.thread = threading.Thread(target=self.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
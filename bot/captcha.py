@@ -8,6 +8,8 @@ import sys
 import threading
 import time
 import requests
+
+from . import metrics
 try:
     from json import read as json_decode, write as json_encode
 except ImportError:
@@ -109,6 +111,7 @@ class Client(object):
         """
         raise NotImplementedError()
 
+    @metrics.captcha_solve_seconds.time()
     def decode(self, captcha=None, timeout=None, **kwargs):
         """
         Try to solve a CAPTCHA.
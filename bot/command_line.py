@@ -1,5 +1,12 @@
 import sys
 
+from . import config, metrics
+from .base.shutdown import shutdown
+from .base.timings import print_summary
+from .base.watchdog import watchdog
+from .base.waits import run as waits_bot
+from .bench.load import run as loadtest_bot
+from .bench.run import run as bench_bot
 from .flow.run import run as flow_bot
 from .login.run import run as login_bot
 from .maps.run import run as maps_bot
@@ -13,8 +20,12 @@ from .vfoflooring.run import run as vfo_bot
 def main(*args, **kwargs):
     bot = sys.argv[1]
 
-    if bot == 'flow':
+    if bot == 'bench':
+        run = bench_bot
+    elif bot == 'flow':
         run = flow_bot
+    elif bot == 'loadtest':
+        run = loadtest_bot
     elif bot == 'login':
         run = login_bot
     elif bot == 'renamer':
@@ -29,6 +40,8 @@ def main(*args, **kwargs):
         run = postcard_bot
     elif bot == 'vfo':
         run = vfo_bot
+    elif bot == 'waits':
+        run = waits_bot
     else:
         raise NotImplementedError(
             "Invalid bot. \"%s\" doesn't exists." % bot
@@ -41,7 +54,22 @@ def main(*args, **kwargs):
             k, v = kwarg.split('=')
             kwargs[k] = v
         except ValueError:
+            if kwarg.startswith('--'):
+                kwargs[kwarg] = True
             continue
 
+    if kwargs.get('--fast-waits'):
+        config.FAST_WAITS = True
+
+    metrics_port = kwargs.get('--metrics-port', config.METRICS_PORT)
+    if metrics_port:
+        metrics.start_server(metrics_port)
+
     print('Running bot "%s" with arguments "%s"' % (bot, kwargs))
-    run(**kwargs)
+    shutdown.install()
+    watchdog.start()
+    try:
+        run(**kwargs)
+    finally:
+        shutdown.quit_drivers()
+        print_summary()
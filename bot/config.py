@@ -36,7 +36,17 @@ CAPTCHA_USERNAME = os.getenv('CAPTCHA_USERNAME')
 CAPTCHA_PASSWORD = os.getenv('CAPTCHA_PASSWORD')
 
 
-MAX_RETRIES = os.getenv('MAX_RETRIES', 5)
+MAX_RETRIES = int(os.getenv('MAX_RETRIES', 5))
+
+INPUT_MODE = os.getenv('INPUT_MODE', 'keys')
+
+RETRY_DEADLINE = float(os.getenv('RETRY_DEADLINE', 60))
+
+RETRY_BACKOFF = float(os.getenv('RETRY_BACKOFF', 0.5))
+
+RETRY_MAX_BACKOFF = float(os.getenv('RETRY_MAX_BACKOFF', 8))
+
+JOB_BUDGET = int(os.getenv('JOB_BUDGET', 0))
 
 INSTANCES = os.getenv('INSTANCES', 1)
 
@@ -48,3 +58,35 @@ STATUS_APPROVED = os.getenv('STATUS_APPROVED', 34)
 STATUS_DENY = os.getenv('STATUS_DENY', 35)
 
 WORKERS = int(os.getenv('WORKERS', 1))
+
+STORAGE_DIR = os.getenv('STORAGE_DIR', BASE_DIR)
+
+PORCH_POLL_MIN = int(os.getenv('PORCH_POLL_MIN', 5))
+
+PORCH_POLL_MAX = int(os.getenv('PORCH_POLL_MAX', 120))
+
+MAPS_CACHE_TTL = int(os.getenv('MAPS_CACHE_TTL', 60 * 60 * 24 * 30))
+
+LISTING_TTL = int(os.getenv('LISTING_TTL', 60 * 60 * 24))
+
+GBM_URL = os.getenv('GBM_URL', 'https://business.google.com')
+
+METRICS_PORT = int(os.getenv('METRICS_PORT', 0))
+
+FAST_WAITS = True if os.getenv('FAST_WAITS') == 'True' else False
+
+WAIT_SCALE = float(os.getenv('WAIT_SCALE', 0))
+
+DRAIN_TIMEOUT = int(os.getenv('DRAIN_TIMEOUT', 120))
+
+CAPTURE_FAILURES = False if os.getenv('CAPTURE_FAILURES') == 'False' else True
+
+CAPTURE_DIR = os.getenv('CAPTURE_DIR', os.path.join(STORAGE_DIR, 'captures'))
+
+WATCHDOG_INTERVAL = int(os.getenv('WATCHDOG_INTERVAL', 60))
+
+WATCHDOG_MAX_RSS = int(os.getenv('WATCHDOG_MAX_RSS', 2048))
+
+WATCHDOG_MAX_CPU = float(os.getenv('WATCHDOG_MAX_CPU', 400))
+
+WATCHDOG_TIMEOUT = int(os.getenv('WATCHDOG_TIMEOUT', 300))
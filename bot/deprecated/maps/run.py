@@ -1,80 +1,106 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import csv
+from fnmatch import fnmatch
 import os
+import traceback
 
+from ...base.selenium import BaseSelenium
+from ... import config
 from .selenium import MapsSelenium
 from .service import MapService
 
 
-def getListOfFiles(dirName):
-    # create a list of file and sub directories
-    # names in the given directory
-    listOfFile = os.listdir(dirName)
-    allFiles = list()
-    # Iterate over all the entries
-    for entry in listOfFile:
-        # Create full path
-        fullPath = os.path.join(dirName, entry)
-        # If entry is a directory then get the list of files in this directory
-        if os.path.isdir(fullPath):
-            allFiles = allFiles + getListOfFiles(fullPath)
-        else:
-            allFiles.append(fullPath)
+def iterFiles(dirName, patterns=('*',)):
+    # Walk the tree lazily, yielding the files matching any pattern
+    with os.scandir(dirName) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iterFiles(entry.path, patterns)
+            elif entry.is_file() and any(
+                fnmatch(entry.name, pattern) for pattern in patterns
+            ):
+                yield entry.path
+
 
-    return allFiles
+def getListOfFiles(dirName):
+    return list(iterFiles(dirName))
 
 
 def run(*args, **kwargs):
     folder = os.getcwd()
-    for file_name in getListOfFiles(folder):
-        if not os.path.isfile(file_name) or not file_name.endswith('.csv'):
-            continue
+    workers = max(int(kwargs.get('--workers', config.WORKERS)), 1)
 
-        print('Working with', file_name)
-        maps_service = MapService()
-        try:
-            object_list = maps_service.get_list(file=file_name)
-        except UnicodeDecodeError:
-            print('Unable to work with', file_name)
-            continue
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Files start as soon as they are found, one failure skips only its
+        # own file.
+        futures = {
+            executor.submit(run_file, file_name): file_name
+            for file_name in iterFiles(folder, patterns=('*.csv',))
+        }
+        for future in as_completed(futures):
+            try:
+                file_name = future.result()
+            except Exception as err:
+                print('Unable to work with', futures[future])
+                print(err)
+                print(traceback.format_exc())
+                continue
+            if file_name:
+                print('Done with', file_name)
 
-        if not object_list:
-            continue
 
+def run_file(file_name):
+    print('Working with', file_name)
+    maps_service = MapService()
+    try:
+        object_list = maps_service.get_list(file=file_name)
+    except UnicodeDecodeError:
+        print('Unable to work with', file_name)
+        return
+
+    if not object_list:
+        return
+
+    browser = BaseSelenium()
+    browser.driver = browser.get_driver(size=(1200, 700))
+    try:
         for obj in object_list:
-            MapsSelenium(entity=obj)
+            MapsSelenium(entity=obj, driver=browser.driver)
+    finally:
+        browser.quit_driver()
 
-        with open(file_name, 'w') as file:
-            writer = csv.DictWriter(file, fieldnames=[
-                'location',
-                'name',
-                'business',
-                'description',
-                'directions',
-                'related_searches'
-            ])
-            writer.writeheader()
+    with open(file_name, 'w') as file:
+        writer = csv.DictWriter(file, fieldnames=[
+            'location',
+            'name',
+            'business',
+            'description',
+            'directions',
+            'related_searches'
+        ])
+        writer.writeheader()
 
-            for obj in object_list:
-                data = dict(
-                    location=obj.location,
-                    name='{main_keyword} {city} - {name}'.format(
-                        main_keyword=obj.main_keyword,
-                        city=obj.location_city,
-                        name=obj.name
-                    ),
-                    business=(
-                        '{name}\n{address}\n{phone}\n{url}\n{cid_url}'
-                    ).format(
-                        name=obj.name,
-                        address=obj.address,
-                        phone=obj.phone_number,
-                        url=obj.url,
-                        cid_url=obj.cid_url
-                    ),
-                    description=obj.description,
-                    directions=obj.directions,
-                    related_searches=obj.related_keywords
-                )
-                writer.writerow(data)
+        for obj in object_list:
+            data = dict(
+                location=obj.location,
+                name='{main_keyword} {city} - {name}'.format(
+                    main_keyword=obj.main_keyword,
+                    city=obj.location_city,
+                    name=obj.name
+                ),
+                business=(
+                    '{name}\n{address}\n{phone}\n{url}\n{cid_url}'
+                ).format(
+                    name=obj.name,
+                    address=obj.address,
+                    phone=obj.phone_number,
+                    url=obj.url,
+                    cid_url=obj.cid_url
+                ),
+                description=obj.description,
+                directions=obj.directions,
+                related_searches=obj.related_keywords
+            )
+            writer.writerow(data)
 
-        file.close()
+    return file_name
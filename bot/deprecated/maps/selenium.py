@@ -3,23 +3,25 @@ import traceback
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 
-from ..base.selenium import BaseSelenium
+from ...base.selenium import BaseSelenium
 
 
 class MapsSelenium(BaseSelenium):
     WAIT_BEFORE_NEXT = 5
     WAIT_BEFORE_INPUT = 10
 
-    def __init__(self, entity, *args, **kwargs):
+    def __init__(self, entity, driver=None, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.entity = entity
+        self.driver = driver
         try:
             self.handle()
         except Exception as err:
             print(err)
             print(traceback.format_exc())
             self._start_debug()
-        self.quit_driver()
+        if driver is None:
+            self.quit_driver()
 
     def handle(self):
         self.driver = self.get_driver(size=(1200, 700))
@@ -1,6 +1,6 @@
 import csv
 
-from ..base.service import BaseEntity, BaseEntityList, BaseService
+from ...base.service import BaseEntity, BaseEntityList, BaseService
 
 
 class Map(BaseEntity):
@@ -17,15 +17,13 @@ class MapService(BaseService):
     entity_list = MapList
 
     def get_list(self, file, **kwargs):
-        data = [i for i in csv.DictReader(open(file, 'r'))]
-        valid_file = True
+        data = []
 
-        for i in data:
-            if 'directions' in i and i['directions']:
-                valid_file = False
-
-        if not valid_file:
-            return
+        with open(file, 'r') as source:
+            for i in csv.DictReader(source):
+                if 'directions' in i and i['directions']:
+                    return
+                data.append(i)
 
         print('Running file: "{}".'.format(file))
 
@@ -1,10 +1,13 @@
-from time import sleep
 from threading import Thread
 
 from selenium.common.exceptions import TimeoutException
 from .selenium import FlowSelenium
 from .service import AccountService, CodeService, GMBService, LeadService
-from ..base.exceptions import CredentialInvalid, GBMException
+from .. import metrics
+from ..base.exceptions import (
+    CredentialInvalid, GBMException, TerminatedByUser
+)
+from ..base.shutdown import shutdown
 from ..config import INSTANCES, STATUS_APPROVED, STATUS_DENY
 
 
@@ -23,8 +26,10 @@ def run_thread_list(*args, **kwargs):
     code = code_service.get_list(**code_kwargs)
 
     while code.count == 0:
+        if shutdown.is_stopping():
+            return []
         print('No codes. Waiting 5 seconds...')
-        sleep(5)
+        shutdown.wait(5)
         code = code_service.get_list(**code_kwargs)
 
     code = code[0]
@@ -35,7 +40,7 @@ def run_thread_list(*args, **kwargs):
 
     if gmb_list.count == 0:
         print('There are no business available. Waiting 10 seconds.')
-        sleep(10)
+        shutdown.wait(10)
         return
 
     code.subscribe()
@@ -48,16 +53,30 @@ def run_thread_list(*args, **kwargs):
         def run_window(entity, code, lead):
             account = account_service.get_detail(entity.account)
             instance = FlowSelenium(entity, account, code, lead)
+            metrics.jobs_started.inc(bot='flow')
             try:
                 instance.handle()
                 entity.patch(is_created=True)
                 lead.patch(status=STATUS_APPROVED)
-            except GBMException:
+                metrics.jobs_succeeded.inc(bot='flow')
+            except TerminatedByUser as err:
+                metrics.jobs_failed.inc(
+                    bot='flow', exception=err.__class__.__name__
+                )
+            except GBMException as err:
+                metrics.jobs_failed.inc(
+                    bot='flow', exception=err.__class__.__name__
+                )
                 lead.patch(status=STATUS_DENY)
-            except CredentialInvalid:
+            except CredentialInvalid as err:
+                metrics.jobs_failed.inc(
+                    bot='flow', exception=err.__class__.__name__
+                )
                 account.path(is_active=False)
-            except TimeoutException:
-                pass
+            except TimeoutException as err:
+                metrics.jobs_failed.inc(
+                    bot='flow', exception=err.__class__.__name__
+                )
 
             instance.quit_driver()
 
@@ -71,7 +90,7 @@ def run_thread_list(*args, **kwargs):
 def run(*args, **kwargs):
     thread_list = []
 
-    while True:
+    while not shutdown.is_stopping():
         if any([
             thread.is_active()
             for thread in thread_list
@@ -83,6 +102,10 @@ def run(*args, **kwargs):
             )
             for i in range(0, 10):
                 print('{}/10'.format(i + 1))
-                sleep(1)
+                shutdown.wait(1)
         else:
             thread_list = run_thread_list(*args, **kwargs)
+
+    for thread in thread_list or []:
+        if isinstance(thread, Thread):
+            thread.join()
@@ -4,6 +4,8 @@ import phonenumbers
 from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 
+from .. import config
+from ..base.hours import Hours
 from ..base.selenium import BaseSelenium
 from ..base.exceptions import CredentialInvalid, GBMException
 from ..config import STATUS_PROCESSING
@@ -23,7 +25,6 @@ class FlowSelenium(BaseSelenium):
     def handle(self):
         self.driver = self.get_driver(size=(1200, 900))
         self.do_login(credential=self.credential)
-        self.go_to_listing()
         self.go_to_created_business()
 
         name = self.get_name()
@@ -48,13 +49,13 @@ class FlowSelenium(BaseSelenium):
                 raise GBMException("Too many retries.")
 
             if retries % 5 == 0:
-                self.driver.switch_to_window(self.driver.window_handles[0])
+                self.driver.switch_to.window(self.driver.window_handles[0])
                 temp_name = name_list[cur_index].format(
                     self.code.person['first_name'],
                     ' '.join(name.split(' ')[1:])
                 )
                 self.do_name(temp_name)
-                self.driver.switch_to_window(self.driver.window_handles[1])
+                self.driver.switch_to.window(self.driver.window_handles[1])
                 cur_index += 1
 
             self.driver.get(self.driver.current_url)
@@ -62,7 +63,7 @@ class FlowSelenium(BaseSelenium):
 
         self.request_code()
 
-        self.driver.switch_to_window(self.driver.window_handles[0])
+        self.driver.switch_to.window(self.driver.window_handles[0])
 
         while not any([self.code.code_1, self.code.code_2, self.code.code_3]):
             self.code = self.code.refresh()
@@ -86,12 +87,12 @@ class FlowSelenium(BaseSelenium):
         '''
 
     def go_to_creation(self):
-        url = 'https://business.google.com/create'
+        url = config.GBM_URL + '/create'
         if not self.driver.current_url.startswith(url):
             self.driver.get(url)
 
     def go_to_listing(self):
-        url = 'https://business.google.com/locations'
+        url = config.GBM_URL + '/locations'
 
         while not self.driver.current_url.startswith(url):
             content = self.get_text(By.TAG_NAME, 'body')
@@ -107,11 +108,28 @@ class FlowSelenium(BaseSelenium):
             self.driver.get(url)
 
     def go_to_created_business(self):
+        account = self.credential.username
+        names = (getattr(self.entity, 'name', None),)
+        listing = self.get_listing_index().get_listing(
+            account, *names, ttl=config.LISTING_TTL
+        )
+        if listing and self.open_listing(listing, names):
+            return
+
+        self.go_to_listing()
         xpath = (
             '//*[@id="yDmH0d"]/c-wiz/div[2]/div[1]/c-wiz/div/c-wiz[3]/div/'
             'span/c-wiz[2]/div[2]/table/tbody/tr[1]'
         )
+        self.get_element(By.XPATH, xpath)
+
+        listings = self.read_listings(account, (xpath[:-len('[1]')],))
+        if listings and self.open_listing(listings[0]):
+            return
+
+        self.go_to_listing()
         row = self.get_element(By.XPATH, xpath)
+
         self.click_element(
             By.XPATH,
             (
@@ -206,7 +224,7 @@ class FlowSelenium(BaseSelenium):
         self.driver.execute_script(
             '''window.open("{}", "_blank");'''.format(url)
         )
-        self.driver.switch_to_window(self.driver.window_handles[1])
+        self.driver.switch_to.window(self.driver.window_handles[1])
         self.driver.get(url)
 
     def has_number_verification(self):
@@ -324,50 +342,9 @@ class FlowSelenium(BaseSelenium):
             By.XPATH,
             '//*[@id="yDmH0d"]/div[4]/div/div[2]/span/section/div[3]/div/div'
         )
-        for element in elements:
-            checkbox = self.get_element(
-                By.XPATH,
-                'label/div',
-                source=element
-            )
-            if checkbox.get_attribute('aria-checked') != 'true':
-                checkbox.click()
-
-            self.click_element(
-                By.XPATH,
-                'div[2]/div[1]/div/div[1]/div[1]/input[2]',
-                source=element
-            )
-
-            if all_day:
-                self.click_element(
-                    By.XPATH,
-                    'div[2]/div[1]/div/div[1]/div[2]/div/div/div[1]',
-                    raise_exception=False,
-                    source=element
-                )
-            else:
-                self.click_element(
-                    By.XPATH,
-                    'div[2]/div[1]/div/div[1]/div[2]/div/div/div[21]',
-                    move=True,
-                    raise_exception=False,
-                    source=element
-                )
-                self.click_element(
-                    By.XPATH,
-                    'div[2]/div[1]/div/div[2]/div[2]/div[1]/input[2]',
-                    raise_exception=False,
-                    source=element
-                )
-                self.click_element(
-                    By.XPATH,
-                    'div[2]/div[1]/div/div[2]/div[2]/div[2]/div/div/div[39]',
-                    move=True,
-                    raise_exception=False,
-                    source=element
-                )
-            self._wait(1)
+        self.set_hours(
+            elements, Hours.all_day() if all_day else Hours.daily(21, 39)
+        )
 
         self.click_element(
             By.XPATH,
@@ -376,7 +353,7 @@ class FlowSelenium(BaseSelenium):
         )
 
     def write_code(self):
-        self.driver.switch_to_window(self.driver.window_handles[1])
+        self.driver.switch_to.window(self.driver.window_handles[1])
 
         codes = [self.code.code_1, self.code.code_2, self.code.code_3]
         codes = [code for code in codes if code]
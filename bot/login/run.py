@@ -1,30 +1,43 @@
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, wait
 from json.decoder import JSONDecodeError
-from time import sleep
 
 from .selenium import GMBTaskSelenium
 from .service import GMBTaskService
-from .. import config
+from .. import config, metrics
+from ..base.exceptions import TerminatedByUser
+from ..base.shutdown import shutdown
 from . import constants
 
 
 def _run_object(obj):
+    metrics.queue_depth.dec(bot='login')
+    if shutdown.is_stopping():
+        return
+
+    metrics.jobs_started.inc(bot='login')
     obj.patch(status=constants.STATUS_RUNNING)
     try:
         GMBTaskSelenium(gmbtask=obj)
+        metrics.jobs_succeeded.inc(bot='login')
+    except TerminatedByUser as err:
+        metrics.jobs_failed.inc(bot='login', exception=err.__class__.__name__)
+        obj.patch(status=constants.STATUS_PENDING)
     except Exception as err:
+        metrics.jobs_failed.inc(bot='login', exception=err.__class__.__name__)
         obj.patch(
             status=constants.STATUS_FAIL, status_message=str(err)
         )
 
 
 def _run_object_list(object_list):
+    metrics.queue_depth.inc(object_list.count, bot='login')
+    futures = []
+
     if config.DEBUG:
         for obj in object_list:
             _run_object(obj)
     else:
         executor = ThreadPoolExecutor(max_workers=config.WORKERS)
-        futures = []
 
         for obj in object_list:
             if config.WORKERS > 1:
@@ -33,14 +46,17 @@ def _run_object_list(object_list):
             else:
                 _run_object(obj)
 
+    return futures
+
 
 def run(*args, **kwargs):
     gmbtask_service = GMBTaskService()
     object_list = None
     next_ = True
+    futures = []
 
-    while True:
-        while next_:
+    while not shutdown.is_stopping():
+        while next_ and not shutdown.is_stopping():
             try:
                 if object_list is None:
                     object_list = gmbtask_service.get_list()
@@ -48,11 +64,14 @@ def run(*args, **kwargs):
                     object_list.get_next_page()
 
                 next_ = True if object_list.next else False
-                _run_object_list(object_list)
+                futures += _run_object_list(object_list)
             except JSONDecodeError:
                 print('Connection error, waiting 5 seconds.')
-                sleep(5)
+                shutdown.wait(5)
 
+        futures = [future for future in futures if not future.done()]
         object_list = None
         next_ = True
-        sleep(10)
+        shutdown.wait(10)
+
+    wait(futures)
@@ -0,0 +1,14 @@
+from ..base.storage import BaseStorage
+
+
+class CIDCache(BaseStorage):
+    filename = 'maps.sqlite3'
+    table = 'cids'
+
+
+class NeighborhoodCache(BaseStorage):
+    filename = 'maps.sqlite3'
+    table = 'neighborhoods'
+
+    def get_key(self, metro_area, state):
+        return '{}|{}'.format(metro_area.strip(), state.strip()).lower()
@@ -0,0 +1,58 @@
+import re
+from urllib.parse import unquote, urlencode
+
+
+MAPS_URL = 'https://www.google.com/maps'
+
+
+def slugify(value):
+    value = str(value)
+    value = re.sub(r'[^\w\s-]', '', value).strip().lower()
+    return re.sub(r'[-\s]+', '-', value)
+
+
+def parse_place_url(url):
+    url = unquote(url or '')
+    response = {'lat': None, 'lng': None, 'mid': None}
+
+    coords = re.search(r'@(-?\d+\.\d+),(-?\d+\.\d+)', url)
+    if coords:
+        response['lat'], response['lng'] = coords.groups()
+
+    # Place URLs carry the knowledge graph id as "!16s/g/..." in `data=`.
+    mid = re.search(r'!16s(/[gm]/[\w-]{5,12})', url)
+    if mid:
+        response['mid'] = mid.group(1)
+
+    return response
+
+
+def streetview_url(lat, lng):
+    return '{}/@?{}'.format(MAPS_URL, urlencode({
+        'api': 1,
+        'map_action': 'pano',
+        'viewpoint': '{},{}'.format(lat, lng),
+    }))
+
+
+def directions_url(origin, destination, travelmode='driving'):
+    return '{}/dir/?{}'.format(MAPS_URL, urlencode({
+        'api': 1,
+        'origin': origin,
+        'destination': destination,
+        'travelmode': travelmode,
+    }))
+
+
+def search_url(name, metro_area, state, mid, place_mid):
+    return (
+        'https://google.com/search?q='
+        + slugify(name).replace('-', '+')
+        + '+'
+        + slugify(metro_area).replace('-', '+')
+        + '+'
+        + slugify(state).replace('-', '+')
+        + '&kponly'
+        + f'&kgmif={mid}'
+        + f'&kgmid={place_mid}'
+    )
@@ -0,0 +1,76 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+import traceback
+
+from .. import config
+from ..logger import Logger
+from .selenium import MapsSelenium
+
+
+class MapsPool:
+    def __init__(self, workers=None, refresh=False):
+        self.workers = max(int(workers or config.WORKERS), 1)
+        self.refresh = refresh
+        self.instances = []
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.logger = Logger()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        with self.lock:
+            instances, self.instances = self.instances, []
+        for instance in instances:
+            instance.quit_driver()
+            instance.close_caches()
+
+    def get_instance(self):
+        instance = getattr(self.local, 'instance', None)
+        if instance is None:
+            instance = MapsSelenium(refresh=self.refresh)
+            self.local.instance = instance
+            with self.lock:
+                self.instances.append(instance)
+        return instance
+
+    def discard_instance(self):
+        instance = self.local.instance
+        self.local.instance = None
+        with self.lock:
+            if instance in self.instances:
+                self.instances.remove(instance)
+        instance.quit_driver()
+        instance.close_caches()
+
+    def handle(self, cid):
+        instance = self.get_instance()
+        instance.set_cid(cid)
+        try:
+            return instance.handle()
+        except Exception as err:
+            self.logger(instance=instance, data={
+                'cid': cid['cid'],
+                'error': err,
+                'traceback': traceback.format_exc(),
+            })
+            # The driver may be left in any state, start over.
+            self.discard_instance()
+            return None
+
+    def map(self, cid_list):
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            return list(executor.map(self.handle, cid_list))
+
+    def imap_unordered(self, cid_list):
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = {
+                executor.submit(self.handle, cid): index
+                for index, cid in enumerate(cid_list)
+            }
+            for future in as_completed(futures):
+                yield futures[future], future.result()
@@ -1,8 +1,12 @@
-import csv
 import os
 import re
 
-from .selenium import MapsSelenium
+from ..spreadsheet import SheetReader
+from .pool import MapsPool
+from .writer import CSVStreamWriter
+
+
+CID_FIELDS = ('cid', 'metro area', 'state', 'name', 'address', 'mid')
 
 
 def validate_cid(value):
@@ -11,12 +15,6 @@ def validate_cid(value):
         raise ValueError(f'Invalid value: "{value}"')
 
 
-def slugify(value):
-    value = str(value)
-    value = re.sub(r'[^\w\s-]', '', value).strip().lower()
-    return re.sub(r'[-\s]+', '-', value)
-
-
 def run(*args, **kwargs):
     filename = kwargs.get('--file', None)
     if filename is None:
@@ -24,30 +22,38 @@ def run(*args, **kwargs):
         return
 
     filepath = os.path.join(os.getcwd(), filename)
-    source = open(filepath, 'r+')
-    reader = csv.DictReader(source)
-    cid_list = []
-    for index, row in enumerate(reader):
-        assert all([row['cid'], row['metro area'], row['state']])
-        validate_cid(row['cid'])
-        cid_list.append(row)
-
-    cid_updated = []
-    for cid in cid_list:
-        selenium = MapsSelenium(cid=cid)
-        if cid['name']:
-            cid_updated.append(cid)
-        else:
-            cid_updated.append(selenium())
-
-    source.seek(0)
-    writer = csv.DictWriter(source, fieldnames=cid_updated[0].keys())
-    writer.writeheader()
-    for cid in cid_updated:
-        writer.writerow(cid)
-    source.truncate()
-    source.close()
-
-    for cid in cid_updated:
-        selenium = MapsSelenium(cid=cid)
-        selenium()
+    with SheetReader(filepath) as reader:
+        fieldnames = list(reader.fieldnames)
+        cid_list = []
+        for index, row in enumerate(reader):
+            assert all([row['cid'], row['metro area'], row['state']])
+            validate_cid(row['cid'])
+            cid_list.append(row)
+
+    for field in CID_FIELDS:
+        if field not in fieldnames:
+            fieldnames.append(field)
+
+    writer = CSVStreamWriter(
+        filepath, fieldnames, key='cid', resume=bool(kwargs.get('--resume'))
+    )
+
+    pool = MapsPool(
+        workers=kwargs.get('--workers'),
+        refresh=bool(kwargs.get('--refresh'))
+    )
+    with pool:
+        pending = [
+            cid for cid in cid_list
+            if not cid['name'] and cid['cid'] not in writer
+        ]
+        try:
+            for index, result in pool.imap_unordered(pending):
+                if result:
+                    writer.write(dict(pending[index], **result))
+        finally:
+            writer.close()
+
+        cid_updated = writer.finalize(cid_list)
+
+        pool.map([cid for cid in cid_updated if cid.get('mid')])
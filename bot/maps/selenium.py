@@ -1,17 +1,45 @@
-import csv
 from datetime import datetime
 import os
-import re
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 
 from ..base.selenium import BaseSelenium
+from .. import config
+from . import links
+from .cache import CIDCache, NeighborhoodCache
+from .writer import CSVStreamWriter
+
+
+PLACE_FIELDS = (
+    'neighborhood name',
+    'city section',
+    'map neighborhood url',
+    'streetview url',
+    'machine id',
+    'driving directions url',
+    'search string url',
+)
+
+
+FIND_MID_SCRIPT = r'''
+var match = document.documentElement.innerHTML.match(/"\/?(g|m)\/.{5,12}"/);
+return match ? match[0] : null;
+'''
 
 
 class MapsSelenium(BaseSelenium):
-    def __init__(self, cid, *args, **kwargs):
+    def __init__(self, cid=None, refresh=False, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self.driver = None
+        self.refresh = refresh
+        self.cid_cache = CIDCache()
+        self.neighborhood_cache = NeighborhoodCache()
+        if cid is not None:
+            self.set_cid(cid)
+
+    def set_cid(self, cid):
+        self.start_budget()
         self.cid = cid
         self.city = None
         self.state = None
@@ -27,13 +55,33 @@ class MapsSelenium(BaseSelenium):
             return self.handle()
         finally:
             self.quit_driver()
+            self.close_caches()
+
+    def close_caches(self):
+        self.cid_cache.close()
+        self.neighborhood_cache.close()
 
     def handle(self):
-        self.driver = self.get_driver(size=(1200, 700))
         if not self.cid.get('mid', None):
+            cached = None
+            if not self.refresh:
+                cached = self.cid_cache.get(
+                    self.cid['cid'], ttl=config.MAPS_CACHE_TTL
+                )
+            if cached:
+                return dict(
+                    cached,
+                    cid=self.cid['cid'],
+                    **{
+                        'metro area': self.cid['metro area'],
+                        'state': self.cid['state'],
+                    }
+                )
+
+            self.driver = self.get_driver(size=(1200, 700))
             self.driver.get(self.cid['cid'])
             self._wait(5)
-            return {
+            response = {
                 'cid': self.cid['cid'],
                 'metro area': self.cid['metro area'],
                 'state': self.cid['state'],
@@ -41,63 +89,125 @@ class MapsSelenium(BaseSelenium):
                 'address': self.get_cid_address(),
                 'mid': self.get_mid_for_result(),
             }
+            if all([response['name'], response['mid']]):
+                self.cid_cache.set(self.cid['cid'], {
+                    'name': response['name'],
+                    'address': response['address'],
+                    'mid': response['mid'],
+                })
+            return response
         else:
-            from .run import slugify
-
-            self.driver.get('https://maps.google.com/')
-            self.do_search()
+            key = self.neighborhood_cache.get_key(
+                self.cid['metro area'], self.cid['state']
+            )
+            response = None
+            if not self.refresh:
+                response = self.neighborhood_cache.get(
+                    key, ttl=config.MAPS_CACHE_TTL
+                )
 
-            results = self.get_results()
-            names = self.get_names(results)
-            response = []
+            if response is None:
+                response = self.get_neighborhoods()
 
-            for index, name in enumerate(names):
-                result = self.get_result(name)
-                link = self.get_share_link_for_result(result)
-                gs360 = self.get_360_link_for_result(result)
-                obj = {
-                    'neighborhood name': name,
-                    'city section': '',
-                    'map neighborhood url': link,
-                    'streetview url': gs360,
-                }
-                response.append(obj)
-                break
+            now = datetime.now()
+            filename = now.strftime(
+                f'{links.slugify(self.cid["name"])}-%Y-%M-%d-%H-%M-%S.csv'
+            )
+            writer = CSVStreamWriter(
+                os.path.join(os.getcwd(), filename),
+                PLACE_FIELDS,
+                key='map neighborhood url'
+            )
 
             for place in response:
                 link = place['map neighborhood url']
-                mid = self.get_mid_for_result(link)
-                driving = self.get_driving_directions_for_result()
-                place['machine id'] = mid
+                if not place.get('machine id'):
+                    place['machine id'] = self.get_mid_for_result(link)
+                    link = None
+
+                directions = place.setdefault('directions', {})
+                driving = directions.get(self.cid['address'])
+                if not driving and self.cid.get('address'):
+                    driving = links.directions_url(
+                        self.get_place_query(place['neighborhood name']),
+                        self.cid['address']
+                    )
+                elif not driving:
+                    driving = self.get_driving_directions_for_result(link)
+                directions[self.cid['address']] = driving
                 place['driving directions url'] = driving
 
                 if all([self.cid['mid'], place['machine id']]):
-                    place['search string url'] = (
-                        'https://google.com/search?q='
-                        + slugify(self.cid['name']).replace('-', '+')
-                        + '+'
-                        + slugify(self.cid['metro area']).replace('-', '+')
-                        + '+'
-                        + slugify(self.cid['state']).replace('-', '+')
-                        + '&kponly'
-                        + f'&kgmif={self.cid["mid"]}'
-                        + f'&kgmid={place["machine id"]}'
+                    place['search string url'] = links.search_url(
+                        self.cid['name'],
+                        self.cid['metro area'],
+                        self.cid['state'],
+                        self.cid['mid'],
+                        place['machine id']
                     )
                 else:
                     place['search string url'] = ''
 
-            now = datetime.now()
-            filename = now.strftime(
-                f'{slugify(self.cid["name"])}-%Y-%M-%d-%H-%M-%S.csv'
-            )
-            file = open(os.path.join(os.getcwd(), filename), 'w+')
+                writer.write(place)
 
-            writer = csv.DictWriter(file, fieldnames=response[0].keys())
-            writer.writeheader()
-            for place in response:
-                writer.writerow(place)
+            self.neighborhood_cache.set(key, response)
+            writer.finalize()
+
+    def get_neighborhoods(self):
+        self.driver = self.get_driver(size=(1200, 700))
+        self.driver.get('https://maps.google.com/')
+        self.do_search()
+
+        results = self.get_results()
+        names = self.get_names(results)
+        response = []
+
+        for index, name in enumerate(names):
+            result = self.get_result(name)
+            place = self.open_result(result)
+            if '/maps/place/' in self.driver.current_url:
+                link = self.driver.current_url
+            else:
+                link = self.get_share_link()
+
+            if place['lat'] and place['lng']:
+                gs360 = links.streetview_url(place['lat'], place['lng'])
+                self.click_element(
+                    By.CSS_SELECTOR,
+                    '[jsaction="pane.place.backToList"]',
+                    raise_exception=False,
+                    max_retries=1
+                )
+            else:
+                gs360 = self.get_360_link_for_result(result)
+
+            obj = {
+                'neighborhood name': name,
+                'city section': '',
+                'map neighborhood url': link,
+                'streetview url': gs360,
+                'machine id': place['mid'],
+            }
+            response.append(obj)
+            break
+
+        return response
+
+    def get_place_query(self, name):
+        return '{}, {} {}'.format(
+            name, self.cid['metro area'], self.cid['state']
+        )
+
+    def open_result(self, result):
+        url = self.driver.current_url
+        result.click()
+
+        for second in range(3):
+            if self.driver.current_url != url:
+                break
+            self._wait(1)
 
-            file.close()
+        return links.parse_place_url(self.driver.current_url)
 
     def get_cid_name(self):
         return self.get_text(
@@ -148,18 +258,26 @@ class MapsSelenium(BaseSelenium):
         return [self.get_name_for_result(r) for r in results]
 
     def get_mid_for_result(self, link=None):
-        source = self.get_source(link=link)
-        mid = re.search(r'"\/?(g|m)\/.{5,12}"', source)
+        if link:
+            # Cached places only need a browser when their MID is missing.
+            self.driver = self.get_driver(size=(1200, 700))
+            self.driver.get(link)
+            self._wait(5)
+
+        mid = links.parse_place_url(self.driver.current_url)['mid']
         if mid:
-            mid = mid.group(0)[1:-1]
-        if mid.endswith('\\'):
+            return mid
+
+        # Search the document in the page, only the match crosses the wire.
+        mid = self.driver.execute_script(FIND_MID_SCRIPT)
+        if mid:
+            mid = mid[1:-1]
+        if mid and mid.endswith('\\'):
             mid = mid[:-1]
         return mid
 
-    def get_share_link_for_result(self, result):
-        result.click()
-        self._wait(3)
-
+    def get_share_link(self):
+        # Reads the link of the place pane open_result left open.
         self.click_element(
             By.CSS_SELECTOR,
             '[jsaction="pane.placeActions.share"]'
@@ -222,6 +340,7 @@ class MapsSelenium(BaseSelenium):
 
     def get_driving_directions_for_result(self, link=None):
         if link:
+            self.driver = self.get_driver(size=(1200, 700))
             self.driver.get(link)
         self.click_element(
             By.CSS_SELECTOR,
@@ -253,10 +372,3 @@ class MapsSelenium(BaseSelenium):
             '[jsaction="pane.copyLink.clickInput"]'
         )
         return element.get_attribute('value')
-
-    def get_source(self, link=None):
-        if link:
-            self.driver.get(link)
-            self._wait(5)
-        element = self.get_element(By.TAG_NAME, 'html')
-        return element.get_attribute('innerHTML')
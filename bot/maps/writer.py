@@ -0,0 +1,74 @@
+import csv
+import os
+
+from ..spreadsheet import SheetWriter, is_excel
+
+
+class CSVStreamWriter:
+    def __init__(
+        self, path, fieldnames, key='cid', batch_size=10, resume=False
+    ):
+        self.path = path
+        self.partial_path = '{}.partial'.format(path)
+        self.fieldnames = list(fieldnames)
+        self.key = key
+        self.batch_size = batch_size
+        self.pending = 0
+        self.done = {}
+
+        exists = os.path.isfile(self.partial_path)
+        if resume and exists:
+            with open(self.partial_path, 'r', newline='') as file:
+                for row in csv.DictReader(file):
+                    self.done[row[self.key]] = row
+
+        self.file = open(
+            self.partial_path, 'a' if resume and exists else 'w', newline=''
+        )
+        self.writer = csv.DictWriter(
+            self.file, fieldnames=self.fieldnames, extrasaction='ignore'
+        )
+        if self.file.tell() == 0:
+            self.writer.writeheader()
+
+    def __contains__(self, key):
+        return key in self.done
+
+    def close(self):
+        if self.file.closed:
+            return
+        self.flush()
+        self.file.close()
+
+    def finalize(self, rows=None):
+        self.close()
+
+        if rows is None:
+            if not is_excel(self.path):
+                os.replace(self.partial_path, self.path)
+                return list(self.done.values())
+            rows = list(self.done.values())
+        else:
+            rows = [self.done.get(row[self.key], row) for row in rows]
+
+        root, extension = os.path.splitext(self.path)
+        tmp_path = '{}.tmp{}'.format(root, extension)
+        with SheetWriter(tmp_path, self.fieldnames) as writer:
+            for row in rows:
+                writer.write(row)
+
+        os.replace(tmp_path, self.path)
+        os.remove(self.partial_path)
+        return rows
+
+    def flush(self):
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.pending = 0
+
+    def write(self, row):
+        self.writer.writerow(row)
+        self.done[row[self.key]] = row
+        self.pending += 1
+        if self.pending >= self.batch_size:
+            self.flush()
@@ -0,0 +1,205 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import functools
+import threading
+import time
+
+
+DEFAULT_BUCKETS = (
+    0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300
+)
+
+
+def format_labels(names, values):
+    if not names:
+        return ''
+    return '{' + ','.join(
+        '{}="{}"'.format(
+            name, str(value).replace('\\', '\\\\').replace('"', '\\"')
+        )
+        for name, value in zip(names, values)
+    ) + '}'
+
+
+class Metric:
+    type = None
+
+    def __init__(self, name, documentation, labels=()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self.lock = threading.Lock()
+        self.values = {}
+        registry.append(self)
+
+    def get_key(self, labels):
+        return tuple(labels.get(name, '') for name in self.labels)
+
+    def render(self):
+        lines = [
+            '# HELP {} {}'.format(self.name, self.documentation),
+            '# TYPE {} {}'.format(self.name, self.type),
+        ]
+        with self.lock:
+            for key, value in sorted(self.values.items()):
+                lines.append('{}{} {}'.format(
+                    self.name, format_labels(self.labels, key), value
+                ))
+        return lines
+
+
+class Counter(Metric):
+    type = 'counter'
+
+    def inc(self, amount=1, **labels):
+        key = self.get_key(labels)
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+
+class Gauge(Metric):
+    type = 'gauge'
+
+    def dec(self, amount=1, **labels):
+        self.inc(-amount, **labels)
+
+    def inc(self, amount=1, **labels):
+        key = self.get_key(labels)
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def set(self, value, **labels):
+        with self.lock:
+            self.values[self.get_key(labels)] = value
+
+
+class Histogram(Metric):
+    type = 'histogram'
+
+    def __init__(self, *args, buckets=DEFAULT_BUCKETS, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.buckets = tuple(buckets)
+
+    def observe(self, seconds, **labels):
+        key = self.get_key(labels)
+        with self.lock:
+            counts, total, count = self.values.get(
+                key, ([0] * len(self.buckets), 0, 0)
+            )
+            for i, bucket in enumerate(self.buckets):
+                if seconds <= bucket:
+                    counts[i] += 1
+            self.values[key] = (counts, total + seconds, count + 1)
+
+    def time(self, **labels):
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                start = time.time()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.observe(time.time() - start, **labels)
+            return wrapper
+        return decorator
+
+    def render(self):
+        lines = [
+            '# HELP {} {}'.format(self.name, self.documentation),
+            '# TYPE {} {}'.format(self.name, self.type),
+        ]
+        names = self.labels + ('le',)
+        with self.lock:
+            for key, (counts, total, count) in sorted(self.values.items()):
+                for bucket, value in zip(self.buckets, counts):
+                    lines.append('{}_bucket{} {}'.format(
+                        self.name, format_labels(names, key + (bucket,)),
+                        value
+                    ))
+                lines.append('{}_bucket{} {}'.format(
+                    self.name, format_labels(names, key + ('+Inf',)), count
+                ))
+                labels = format_labels(self.labels, key)
+                lines.append('{}_sum{} {}'.format(self.name, labels, total))
+                lines.append('{}_count{} {}'.format(self.name, labels, count))
+        return lines
+
+
+registry = []
+
+
+jobs_started = Counter(
+    'bot_jobs_started_total', 'Jobs started.', ['bot']
+)
+
+jobs_succeeded = Counter(
+    'bot_jobs_succeeded_total', 'Jobs finished without errors.', ['bot']
+)
+
+jobs_failed = Counter(
+    'bot_jobs_failed_total', 'Jobs failed, by exception.',
+    ['bot', 'exception']
+)
+
+queue_depth = Gauge(
+    'bot_queue_depth', 'Jobs waiting to run.', ['bot']
+)
+
+active_browsers = Gauge(
+    'bot_active_browsers', 'Open WebDriver sessions.'
+)
+
+api_request_seconds = Histogram(
+    'bot_api_request_seconds', 'Panel API request latency.',
+    ['service', 'method']
+)
+
+captcha_solve_seconds = Histogram(
+    'bot_captcha_solve_seconds', 'Time to solve a captcha.'
+)
+
+browser_recycles = Counter(
+    'bot_browser_recycles_total', 'Browsers recycled by the watchdog.',
+    ['reason']
+)
+
+orphans_reaped = Counter(
+    'bot_orphans_reaped_total', 'Orphaned browser processes killed.'
+)
+
+wait_seconds = Counter(
+    'bot_wait_seconds_total', 'Seconds spent in fixed waits.'
+)
+
+
+def render():
+    lines = []
+    for metric in registry:
+        lines += metric.render()
+    return '\n'.join(lines) + '\n'
+
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.split('?')[0] != '/metrics':
+            self.send_response(404)
+            self.end_headers()
+            return
+
+        content = render().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+
+def start_server(port, host='0.0.0.0'):
+    server = ThreadingHTTPServer((host, int(port)), MetricsHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    return server
@@ -0,0 +1,22 @@
+import time
+
+from ..base.storage import BaseStorage
+
+
+class LeadIndex(BaseStorage):
+    filename = 'porch.sqlite3'
+    table = 'leads'
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.links = set(
+            value['link'] for key, value in self.items()
+            if value.get('link')
+        )
+
+    def add(self, token, link):
+        self.set(token, {'link': link, 'date_sent': time.time()})
+        self.links.add(link)
+
+    def get_new_links(self, links):
+        return [link for link in links if link not in self.links]
@@ -3,4 +3,4 @@ from .selenium import PorchSelenium
 
 def run(*args, **kwargs):
     selenium = PorchSelenium()
-    selenium()
+    selenium(daemon=bool(kwargs.get('--daemon', False)))
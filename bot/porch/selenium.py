@@ -1,34 +1,117 @@
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
 import json
 
 import requests
+from requests.adapters import HTTPAdapter
 from selenium.webdriver.common.by import By
 
 from ..base.selenium import BaseSelenium
+from ..base.shutdown import shutdown
 from .. import config
+from .index import LeadIndex
+
+
+class JSONModelParser(HTMLParser):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.chunks = []
+        self.done = False
+        self.tag = None
+
+    def handle_starttag(self, tag, attrs):
+        if self.tag is None and dict(attrs).get('id') == 'jsonModel':
+            self.tag = tag
+
+    def handle_endtag(self, tag):
+        if self.tag == tag and not self.done:
+            self.done = True
+
+    def handle_data(self, data):
+        if self.tag and not self.done:
+            self.chunks.append(data)
+
+    @property
+    def content(self):
+        if not self.done:
+            return None
+        return ''.join(self.chunks).strip() or None
 
 
 class PorchSelenium(BaseSelenium):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self.index = LeadIndex()
 
-    def __call__(self):
+    def __call__(self, daemon=False):
         try:
+            if daemon:
+                return self.poll()
             return self.handle()
         except Exception as err:
             print(err)
             self._wait(10)
         finally:
             self.quit_driver()
+            self.index.close()
 
     def handle(self):
         self.driver = self.get_driver(size=(1200, 700))
         self.do_login()
         self.go_to_oportunities()
-        links = self.get_list_items()
-        for link in links:
-            content = self.get_link_data(link)
-            self.send_to_airtable(content)
-        self._wait(10)
+        self.process_links(self.get_list_items())
+
+    def poll(self):
+        self.driver = self.get_driver(size=(1200, 700))
+        self.do_login()
+        interval = config.PORCH_POLL_MIN
+
+        while not shutdown.is_stopping():
+            self.start_budget()
+            try:
+                self.go_to_oportunities()
+                if '/login' in self.driver.current_url:
+                    self.do_login()
+                    self.go_to_oportunities()
+
+                links = self.get_list_items(raise_exception=False)
+                sent = self.process_links(links)
+            except Exception as err:
+                print(err)
+                sent = 0
+
+            if sent:
+                interval = config.PORCH_POLL_MIN
+            else:
+                interval = min(interval * 2, config.PORCH_POLL_MAX)
+
+            if config.DEBUG:
+                print('Next poll in {} seconds.'.format(interval))
+            shutdown.wait(interval)
+
+    def process_links(self, links):
+        links = self.index.get_new_links(links)
+        if not links:
+            return 0
+
+        self.session = self.get_session()
+        sent = 0
+
+        for link, content in self.get_links_data(links):
+            content = self.parse_content(content)
+            # Leads without a token are keyed by their link.
+            token = content.get('token') or 'link:' + link
+
+            if token in self.index:
+                self.index.add(token, link)
+                continue
+
+            if self.send_to_airtable(content):
+                sent += 1
+                self.index.add(token, link)
+
+        self.logger(instance=self, data={'new': len(links), 'sent': sent})
+        return sent
 
     def do_login(self):
         self.driver.get('https://pro.homeadvisor.com/login?execution=e1s1')
@@ -40,14 +123,18 @@ class PorchSelenium(BaseSelenium):
         self.driver.get('https://pro.homeadvisor.com/opportunities/')
         self._wait(5)
 
-    def get_list_items(self):
+    def get_list_items(self, raise_exception=True):
         elements = []
         response = []
 
         while len(elements) == 0:
             elements = self.get_elements(
-                By.CSS_SELECTOR, '.lead-card-link'
+                By.CSS_SELECTOR,
+                '.lead-card-link',
+                raise_exception=raise_exception
             )
+            if elements is False:
+                return response
 
         for element in elements:
             link = element.get_attribute('href')
@@ -57,6 +144,57 @@ class PorchSelenium(BaseSelenium):
             response.append(link)
         return response
 
+    def get_session(self):
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1, pool_maxsize=max(config.WORKERS, 1)
+        )
+        session.mount('https://', adapter)
+        session.headers['User-Agent'] = self.driver.execute_script(
+            'return navigator.userAgent;'
+        )
+        for cookie in self.driver.get_cookies():
+            session.cookies.set(
+                cookie['name'],
+                cookie['value'],
+                domain=cookie.get('domain'),
+                path=cookie.get('path', '/')
+            )
+        return session
+
+    def get_links_data(self, links):
+        with ThreadPoolExecutor(max_workers=config.WORKERS) as executor:
+            contents = list(executor.map(self.fetch_link_data, links))
+
+        for link, content in zip(links, contents):
+            if content is None:
+                # Session lost or unexpected markup, use the browser.
+                content = self.get_link_data(link)
+            yield link, content
+
+    def fetch_link_data(self, link):
+        parser = JSONModelParser()
+        try:
+            response = self.session.get(link, stream=True, timeout=30)
+        except requests.RequestException as err:
+            self.logger(instance=self, data={'link': link, 'error': err})
+            return None
+
+        try:
+            if response.status_code != 200:
+                return None
+            response.encoding = response.encoding or 'utf-8'
+            for chunk in response.iter_content(
+                chunk_size=8192, decode_unicode=True
+            ):
+                parser.feed(chunk)
+                if parser.done:
+                    break
+        finally:
+            response.close()
+
+        return parser.content
+
     def get_link_data(self, link):
         self.driver.get(link)
         content = self.get_element(By.ID, 'jsonModel')
@@ -105,13 +243,17 @@ class PorchSelenium(BaseSelenium):
         return response
 
     def send_to_airtable(self, content):
-        content = self.parse_content(content)
         url = config.HA_AIRTABLE
         content = dict(records=[dict(fields=content)])
         response = requests.post(url, json=content, headers={
             'Authorization': f'Bearer {config.HA_AIRTABLE_KEY}'
         })
         if response.status_code >= 200 and response.status_code < 300:
-            return
-        import pdb
-        pdb.set_trace()
+            return True
+        self._start_debug(
+            message='Airtable error {}.'.format(response.status_code),
+            # Lead values are personal data, only the field names are kept.
+            fields=sorted(content['records'][0]['fields']),
+            response=response.text[:500], page=False
+        )
+        return False
@@ -0,0 +1,36 @@
+import os
+import time
+
+import psutil
+
+from ..base.storage import BaseStorage
+
+
+class ClaimLock(BaseStorage):
+    filename = 'postcards.sqlite3'
+    table = 'claims'
+
+    def acquire(self, pk):
+        # BEGIN IMMEDIATE takes the database write lock, which every runner
+        # process on this host shares. A claim left by a runner that is no
+        # longer alive is taken over.
+        with self.lock:
+            self.connection.execute('BEGIN IMMEDIATE')
+            try:
+                row = self.connection.execute(
+                    'SELECT value FROM {} WHERE key = ?'.format(self.table),
+                    (str(pk),)
+                ).fetchone()
+                if row and psutil.pid_exists(int(row[0])):
+                    return False
+                self.connection.execute(
+                    'INSERT OR REPLACE INTO {} (key, value, updated) '
+                    'VALUES (?, ?, ?)'.format(self.table),
+                    (str(pk), str(os.getpid()), time.time())
+                )
+                return True
+            finally:
+                self.connection.commit()
+
+    def release(self, pk):
+        self.delete(str(pk))
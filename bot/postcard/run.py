@@ -1,28 +1,95 @@
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from json.decoder import JSONDecodeError
-from time import sleep
+import traceback
 
 from selenium.common.exceptions import ElementClickInterceptedException
 
+from .index import ClaimLock
 from .selenium import PostcardSelenium
 from .service import PostcardService
+from .. import config, metrics
 from ..base .exceptions import CredentialInvalid, MaxRetries
+from ..base.shutdown import shutdown
 
 
-def _run(object_list):
-    for obj in object_list:
-        if not obj.verification_address and not obj.name:
-            continue
-        obj.patch(status='creating')
-        try:
-            PostcardSelenium(postcard=obj)
-            if obj.recipient:
-                obj.patch(status='requested')
-            else:
-                obj.patch(status='created')
-        except (MaxRetries, ElementClickInterceptedException):
+def _run_object(obj, lock):
+    metrics.jobs_started.inc(bot='postcard')
+    try:
+        PostcardSelenium(postcard=obj)
+        if shutdown.cancelled.is_set():
+            # Release the claim so the next run picks it up again.
             obj.patch(status='not-created')
-        except CredentialInvalid:
-            obj.patch(status='denied')
+            return
+        if obj.recipient:
+            obj.patch(status='requested')
+        else:
+            obj.patch(status='created')
+        metrics.jobs_succeeded.inc(bot='postcard')
+    except (MaxRetries, ElementClickInterceptedException) as err:
+        metrics.jobs_failed.inc(
+            bot='postcard', exception=err.__class__.__name__
+        )
+        obj.patch(status='not-created')
+    except CredentialInvalid as err:
+        metrics.jobs_failed.inc(
+            bot='postcard', exception=err.__class__.__name__
+        )
+        obj.patch(status='denied')
+    except Exception as err:
+        metrics.jobs_failed.inc(
+            bot='postcard', exception=err.__class__.__name__
+        )
+        print(err)
+        print(traceback.format_exc())
+        # Anything else leaves the postcard free for another try.
+        obj.patch(status='not-created')
+    finally:
+        lock.release(obj.pk)
+
+
+def _run(object_list):
+    pending = [
+        obj for obj in object_list
+        if obj.verification_address or obj.name
+    ]
+    running = {}
+    lock = ClaimLock()
+
+    with ThreadPoolExecutor(max_workers=config.WORKERS) as executor:
+        while pending or running:
+            if shutdown.is_stopping():
+                pending = []
+            metrics.queue_depth.set(len(pending), bot='postcard')
+            for obj in list(pending):
+                if len(running) >= config.WORKERS:
+                    break
+
+                # One wizard per Google account at a time.
+                account = obj.get_account_key()
+                if account in running.values():
+                    continue
+
+                pending.remove(obj)
+                if not obj.claim(lock):
+                    continue
+                running[executor.submit(_run_object, obj, lock)] = account
+
+            if not running:
+                continue
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                running.pop(future)
+                try:
+                    future.result()
+                except Exception as err:
+                    metrics.jobs_failed.inc(
+                        bot='postcard', exception=err.__class__.__name__
+                    )
+                    print(err)
+                    print(traceback.format_exc())
+
+    lock.close()
 
 
 def run(*args, **kwargs):
@@ -30,8 +97,8 @@ def run(*args, **kwargs):
     object_list = None
     next_ = True
 
-    while True:
-        while next_:
+    while not shutdown.is_stopping():
+        while next_ and not shutdown.is_stopping():
             try:
                 if object_list is None:
                     object_list = postcard_service.get_list()
@@ -42,8 +109,8 @@ def run(*args, **kwargs):
                 _run(object_list)
             except JSONDecodeError:
                 print('Connection error, waiting 5 seconds.')
-                sleep(5)
+                shutdown.wait(5)
 
         object_list = None
         next_ = True
-        sleep(10)
+        shutdown.wait(10)
@@ -1,5 +1,6 @@
 from selenium.webdriver.common.by import By
 
+from .. import config
 from ..base.selenium import BaseSelenium
 from ..base.exceptions import MaxRetries
 from ..utils import permute_characters, remove_words_with_numbers
@@ -21,7 +22,7 @@ class PostcardSelenium(BaseSelenium):
     def handle(self):
         self.driver = self.get_driver(size=(1200, 700))
         self.do_login(
-            self.postcard.account, url='https://business.google.com/create'
+            self.postcard.account, url=config.GBM_URL + '/create'
         )
         self.do_name()
         self.do_can_visit()
@@ -165,6 +166,7 @@ class PostcardSelenium(BaseSelenium):
             By.CSS_SELECTOR,
             'input[aria-label="Street address"]',
             permute_characters(street) if self.postcard.recipient else street,
+            mode='script',
             max_retries=1,
             raise_exception=False
         ):
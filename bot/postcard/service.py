@@ -5,6 +5,32 @@ class Postcard(BaseEntity):
     def __str__(self):
         return self.username
 
+    def claim(self, lock):
+        # The panel API has no conditional update, so this is a
+        # check-then-act. The lock keeps runners on the same host from
+        # claiming the same postcard; runners on different hosts can still
+        # both see it free and both claim it.
+        try:
+            if self.refresh().status != 'not-created':
+                return False
+            if not lock.acquire(self.pk):
+                return False
+        except Exception as err:
+            print(err)
+            return False
+
+        try:
+            self.patch(status='creating')
+        except Exception as err:
+            print(err)
+            lock.release(self.pk)
+            return False
+        return True
+
+    def get_account_key(self):
+        account = self.account
+        return account.username if account else None
+
 
 class PostcardList(BaseEntityList):
     entity = Postcard
@@ -1,3 +1,4 @@
+from ..base.shutdown import shutdown
 from .selenium import RenamerSelenium
 from .service import BusinessService
 
@@ -7,4 +8,6 @@ def run(*args, **kwargs):
     object_list = biz_service.get_list()
 
     for obj in object_list:
+        if shutdown.is_stopping():
+            break
         RenamerSelenium(entity=obj)
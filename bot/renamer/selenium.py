@@ -3,20 +3,71 @@ import platform
 from random import randint
 import traceback
 
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 
 
-from .. import constants
+from .. import config, constants
 from ..base.exceptions import (
     CredentialInvalid, EmptyList, EntityInvalid,
     EntityIsSuccess, InvalidValidationMethod, NotFound, MaxRetries
 )
+from ..base.hours import Hours
 from ..base.selenium import BaseSelenium
 
 
+READ_SECTIONS_SCRIPT = r'''
+var sections = arguments[0], values = {};
+Object.keys(sections).forEach(function (name) {
+    var node = document.evaluate(
+        sections[name], document, null,
+        XPathResult.FIRST_ORDERED_NODE_TYPE, null
+    ).singleNodeValue;
+    values[name] = node ? node.innerText : null;
+});
+return values;
+'''
+
+LOCATION_ROWS = (
+    '/html/body/div[4]/c-wiz/div[2]/div[1]/c-wiz/div/c-wiz[3]'
+    '/div/content/c-wiz[2]/div[2]/table/tbody/tr',
+    '/html/body/div[7]/c-wiz/div[2]/div[1]/c-wiz/div/c-wiz[3]'
+    '/div/content/c-wiz[2]/div[2]/table/tbody/tr'
+)
+
+EDIT_SECTION = (
+    '//*[@id="main_viewpane"]/c-wiz[1]/div/div[1]/div[2]/content/div[{}]'
+)
+
+# Edit steps, the section each one edits and the field it sets, if any.
+# Steps without a field are skipped only when the section already shows
+# what they would write.
+EDIT_STEPS = (
+    ('do_final_name', 2, 'final_name'),
+    ('do_final_category_1', 3, 'final_category_1'),
+    ('do_service_area', 5, 'final_city'),
+    ('do_hours', 6, None),
+    ('do_special_hours', 7, None),
+    ('do_website', 9, 'final_website'),
+    ('do_attributes', 10, None),
+    ('do_description', 11, 'final_description'),
+    ('do_opening_date', 12, None),
+)
+
+
+def normalize(value):
+    return ' '.join(str(value).split()).lower()
+
+
+def normalize_url(value):
+    value = normalize(value).split('://')[-1]
+    if value.startswith('www.'):
+        value = value[4:]
+    return value.rstrip('/')
+
+
 class RenamerSelenium(BaseSelenium):
     WAIT_BEFORE_NEXT = 5
     WAIT_BEFORE_INPUT = 10
@@ -24,6 +75,7 @@ class RenamerSelenium(BaseSelenium):
     def __init__(self, entity, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.entity = entity
+        self.listing = None
         try:
             self.handle()
         except (CredentialInvalid, EntityInvalid, InvalidValidationMethod):
@@ -45,15 +97,11 @@ class RenamerSelenium(BaseSelenium):
         self.do_login()
         self.do_open_verification_tab()
         self.go_to_edit()
-        self.do_final_name()
-        self.do_final_category_1()
-        self.do_service_area()
-        self.do_hours()
-        self.do_special_hours()
-        self.do_website()
-        self.do_attributes()
-        self.do_description()
-        self.do_opening_date()
+
+        changes = self.get_changes()
+        for name, section, field in EDIT_STEPS:
+            if name in changes:
+                getattr(self, name)()
 
         self.do_code_fill()
 
@@ -68,6 +116,11 @@ class RenamerSelenium(BaseSelenium):
         self.quit_driver()
 
     def go_to_edit(self):
+        listing = self.get_listing()
+        names = (self.entity.name, self.entity.final_name)
+        if listing and self.open_listing(listing, names):
+            return
+
         row = self.get_business_row()
         self.click_element(
             By.XPATH,
@@ -80,18 +133,55 @@ class RenamerSelenium(BaseSelenium):
         current_url = self.driver.current_url
         self.driver.get(current_url.replace('/dashboard/', '/edit/'))
 
+    def get_listing(self):
+        if self.listing:
+            return self.listing
+
+        account = getattr(self.entity, 'username', '')
+        names = (self.entity.name, self.entity.final_name)
+        index = self.get_listing_index()
+
+        # A recent entry goes straight to its page, the table is only read
+        # again when it is missing or the page shows another business.
+        listing = index.get_listing(account, *names, ttl=config.LISTING_TTL)
+        if listing and self.open_listing(listing, names):
+            # A saved status may be stale, the row is read again before
+            # verifying.
+            self.listing = dict(listing, status=None)
+            return self.listing
+
+        url = config.GBM_URL + '/locations'
+        if self.driver.current_url != url:
+            self.driver.get(url)
+        self.get_elements(
+            By.XPATH, LOCATION_ROWS, raise_exception=False, timeout=5
+        )
+
+        listings = self.read_listings(account, LOCATION_ROWS)
+        self.listing = index.get_listing(account, *names)
+
+        for listing in listings:
+            if self.listing:
+                break
+            if any(
+                name and normalize(name) in normalize(listing['name'])
+                for name in names
+            ):
+                self.listing = listing
+
+        if self.listing and not listings:
+            # Only the edit URL can be trusted without a fresh status.
+            self.listing = dict(self.listing, status=None)
+        return self.listing
+
     def get_business_row(self):
-        if self.driver.current_url != 'https://business.google.com/locations':
-            self.driver.get('https://business.google.com/locations')
+        url = config.GBM_URL + '/locations'
+        if self.driver.current_url != url:
+            self.driver.get(url)
 
         rows = self.get_elements(
             By.XPATH,
-            (
-                '/html/body/div[4]/c-wiz/div[2]/div[1]/c-wiz/div/c-wiz[3]'
-                '/div/content/c-wiz[2]/div[2]/table/tbody/tr',
-                '/html/body/div[7]/c-wiz/div[2]/div[1]/c-wiz/div/c-wiz[3]'
-                '/div/content/c-wiz[2]/div[2]/table/tbody/tr'
-            ),
+            LOCATION_ROWS,
             raise_exception=False,
             timeout=5
         )
@@ -111,7 +201,77 @@ class RenamerSelenium(BaseSelenium):
 
         return row
 
+    def get_current_values(self):
+        try:
+            values = self.driver.execute_script(READ_SECTIONS_SCRIPT, {
+                name: EDIT_SECTION.format(section)
+                for name, section, field in EDIT_STEPS
+            })
+        except WebDriverException as err:
+            self.logger(data="Cannot read the edit page: {}".format(err))
+            return {}
+        return values or {}
+
+    def get_changes(self):
+        self.get_element(
+            By.XPATH, EDIT_SECTION.format(EDIT_STEPS[0][1]), timeout=5
+        )
+        values = self.get_current_values()
+
+        changes = set()
+        for name, section, field in EDIT_STEPS:
+            if not self.is_current(name, field, values.get(name)):
+                changes.add(name)
+
+        self.logger(data={
+            'skipped': [
+                name for name, section, field in EDIT_STEPS
+                if name not in changes
+            ]
+        })
+        return changes
+
+    def is_current(self, name, field, text):
+        if not text:
+            return False
+
+        lines = [normalize(line) for line in text.splitlines()]
+        lines = [line for line in lines if line]
+        if not lines or any(line.startswith('add ') for line in lines):
+            return False
+        if name == 'do_hours':
+            return Hours.all_day().matches_summary(text)
+        if not field:
+            # Special hours, attributes and the opening date are not read
+            # back, so they are always written.
+            return False
+
+        value = getattr(self.entity, field, None)
+        if not value:
+            return True
+
+        if name == 'do_service_area':
+            value = normalize('{}, {}'.format(value, self.entity.final_state))
+            return any(line.startswith(value) for line in lines)
+        if name == 'do_website':
+            return normalize_url(value) in [
+                normalize_url(line) for line in lines
+            ]
+        if name == 'do_description':
+            return normalize(value) in normalize(text)
+        return normalize(value) in lines
+
     def do_open_verification_tab(self):
+        listing = self.get_listing()
+        if listing and listing['status'] and listing['verify']:
+            self.check_status(listing['status'])
+            self.driver.execute_script(
+                'window.open(arguments[0]);', listing['verify']
+            )
+            self.driver.switch_to.window(self.driver.window_handles[1])
+            self.do_verification_tab()
+            return
+
         row = self.get_business_row()
 
         status = self.get_element(
@@ -132,10 +292,7 @@ class RenamerSelenium(BaseSelenium):
                 source=row
             ).text
 
-        if status.strip() == 'Published':
-            raise EntityIsSuccess
-        elif status.strip() == 'Suspended':
-            raise EntityInvalid
+        self.check_status(status)
 
         element = self.get_element(
             By.XPATH,
@@ -160,6 +317,15 @@ class RenamerSelenium(BaseSelenium):
                 .perform()
 
         self.driver.switch_to.window(self.driver.window_handles[1])
+        self.do_verification_tab()
+
+    def check_status(self, status):
+        if status.strip() == 'Published':
+            raise EntityIsSuccess
+        elif status.strip() == 'Suspended':
+            raise EntityInvalid
+
+    def do_verification_tab(self):
         text = self.get_element(
             By.XPATH, '//body', move=False, timeout=5
         ).text.strip()
@@ -324,25 +490,7 @@ class RenamerSelenium(BaseSelenium):
             '//*[@id="js"]/div[10]/div/div[2]/content/div/div[3]/div/div',
             timeout=self.WAIT_BEFORE_NEXT
         )
-        for element in elements:
-            checkbox = self.get_element(
-                By.XPATH,
-                'label/div',
-                source=element
-            )
-            if checkbox.get_attribute('aria-checked') != 'true':
-                checkbox.click()
-
-            self.click_element(
-                By.XPATH,
-                'div[2]/div[1]/div/div[1]/div[1]/input[2]',
-                source=element
-            )
-            self.click_element(
-                By.XPATH,
-                'div[2]/div[1]/div/div[1]/div[2]/div/div/div[1]',
-                source=element
-            )
+        self.set_hours(elements, Hours.all_day())
 
         self.click_element(
             By.XPATH,
@@ -489,7 +637,12 @@ class RenamerSelenium(BaseSelenium):
             xpath_input,
             timeout=self.WAIT_BEFORE_INPUT
         )
-        self.fill_input(By.XPATH, xpath_input, self.entity.final_description)
+        self.fill_input(
+            By.XPATH,
+            xpath_input,
+            self.entity.final_description,
+            mode='script'
+        )
         self.click_element(
             By.XPATH,
             '//*[@id="js"]/div[10]/div/div[2]/content/div/div[5]/div[2]',
@@ -562,7 +715,7 @@ class RenamerSelenium(BaseSelenium):
         )
 
     def do_code_fill(self):
-        self.driver.switch_to_window(self.driver.window_handles[1])
+        self.driver.switch_to.window(self.driver.window_handles[1])
 
         success = self.click_element(
             By.XPATH,
@@ -631,7 +784,7 @@ class RenamerSelenium(BaseSelenium):
         self.fill_input(By.XPATH, xpath_code, code)
 
     def do_address(self):
-        self.driver.switch_to_window(self.driver.window_handles[0])
+        self.driver.switch_to.window(self.driver.window_handles[0])
 
         self.click_element(
             By.XPATH,
@@ -667,7 +820,8 @@ class RenamerSelenium(BaseSelenium):
                     state=constants.STATES[self.entity.final_state],
                     zip_code=self.entity.final_zip_code
                 )
-            )
+            ),
+            mode='script'
         )
 
         # Zip Code
@@ -0,0 +1,158 @@
+import csv
+import os
+import time
+import tracemalloc
+
+from openpyxl import Workbook, load_workbook
+
+
+EXCEL_EXTENSIONS = ('.xlsx', '.xlsm')
+
+
+def is_excel(path):
+    return os.path.splitext(path)[1].lower() in EXCEL_EXTENSIONS
+
+
+def cell_value(value):
+    if value is None:
+        return ''
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value)
+
+
+class SheetReader:
+    def __init__(self, path):
+        self.path = path
+        self.workbook = None
+        self.file = None
+
+        if is_excel(path):
+            self.workbook = load_workbook(
+                path, read_only=True, data_only=True
+            )
+            self.rows = self.workbook.active.iter_rows(values_only=True)
+            header = next(self.rows, None) or ()
+            self.fieldnames = [cell_value(value) for value in header]
+        else:
+            self.file = open(path, 'r', newline='')
+            self.rows = csv.DictReader(self.file)
+            self.fieldnames = list(self.rows.fieldnames or [])
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __iter__(self):
+        if self.workbook is None:
+            yield from self.rows
+            return
+
+        for values in self.rows:
+            if not any(value is not None for value in values):
+                continue
+            yield dict(zip(
+                self.fieldnames, [cell_value(value) for value in values]
+            ))
+
+    def close(self):
+        if self.workbook is not None:
+            self.workbook.close()
+        if self.file is not None:
+            self.file.close()
+
+
+class SheetWriter:
+    def __init__(self, path, fieldnames):
+        self.path = path
+        self.fieldnames = list(fieldnames)
+        self.workbook = None
+        self.file = None
+
+        if is_excel(path):
+            self.workbook = Workbook(write_only=True)
+            self.sheet = self.workbook.create_sheet()
+            self.sheet.append(self.fieldnames)
+        else:
+            self.file = open(path, 'w', newline='')
+            self.writer = csv.DictWriter(
+                self.file, fieldnames=self.fieldnames, extrasaction='ignore'
+            )
+            self.writer.writeheader()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        if self.workbook is not None:
+            self.workbook.save(self.path)
+            self.workbook = None
+        if self.file is not None:
+            self.file.flush()
+            os.fsync(self.file.fileno())
+            self.file.close()
+            self.file = None
+
+    def write(self, row):
+        if self.workbook is not None:
+            self.sheet.append([row.get(f, '') for f in self.fieldnames])
+        else:
+            self.writer.writerow(row)
+
+
+def benchmark(directory, rows=100000):
+    fieldnames = ['cid', 'metro area', 'state', 'name', 'address', 'mid']
+    response = {}
+
+    for extension in ('csv', 'xlsx'):
+        path = os.path.join(directory, 'benchmark.{}'.format(extension))
+
+        start = time.time()
+        with SheetWriter(path, fieldnames) as writer:
+            for i in range(rows):
+                writer.write({
+                    'cid': 'https://www.google.com/maps?cid={:020d}'.format(i),
+                    'metro area': 'Austin',
+                    'state': 'TX',
+                    'name': 'Business {}'.format(i),
+                    'address': '{} Main St, Austin, TX 78701'.format(i),
+                    'mid': '/g/{:08d}'.format(i),
+                })
+        write_time = time.time() - start
+
+        start = time.time()
+        with SheetReader(path) as reader:
+            count = sum(1 for row in reader)
+        read_time = time.time() - start
+
+        tracemalloc.start()
+        with SheetReader(path) as reader:
+            for row in reader:
+                pass
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        os.remove(path)
+
+        response[extension] = {
+            'rows': count,
+            'write': round(write_time, 2),
+            'read': round(read_time, 2),
+            'read_peak_mb': round(peak / 1024 / 1024, 2),
+        }
+
+    return response
+
+
+if __name__ == '__main__':
+    import sys
+    import tempfile
+
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    with tempfile.TemporaryDirectory() as directory:
+        for extension, result in benchmark(directory, rows).items():
+            print(extension, result)
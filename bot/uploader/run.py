@@ -1,10 +1,41 @@
+import os
+
+from ..base.shutdown import shutdown
+from ..spreadsheet import SheetWriter
 from .selenium import UploaderSelenium
 from .service import CredentialService
 
 
+EXPORT_FIELDS = (
+    'pk',
+    'name',
+    'status',
+    'email',
+    'recovery_email',
+    'final_address',
+    'final_city',
+    'final_state',
+    'final_zip_code',
+    'final_country',
+    'final_phone_number',
+)
+
+
 def run(*args, **kwargs):
     credential_service = CredentialService()
     object_list = credential_service.get_list()
+    writer = None
+
+    if kwargs.get('--export'):
+        writer = SheetWriter(
+            os.path.join(os.getcwd(), kwargs['--export']), EXPORT_FIELDS
+        )
 
-    for obj in object_list:
-        UploaderSelenium(entity=obj)
+    try:
+        for obj in object_list:
+            if shutdown.is_stopping():
+                break
+            UploaderSelenium(entity=obj, writer=writer)
+    finally:
+        if writer:
+            writer.close()
@@ -6,6 +6,7 @@ from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 
+from .. import config
 from ..constants import COUNTRY_CHOICES
 from ..base.exceptions import (
     CredentialInvalid, EmptyList, EntityInvalid,
@@ -20,9 +21,10 @@ from .service import BusinessService
 class UploaderSelenium(BaseSelenium):
     active_list = []
 
-    def __init__(self, entity, *args, **kwargs):
+    def __init__(self, entity, writer=None, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.entity = entity
+        self.writer = writer
         self.biz_service = BusinessService()
         try:
             self.handle()
@@ -52,7 +54,7 @@ class UploaderSelenium(BaseSelenium):
         self.report_success()
 
     def go_to_manager(self):
-        url = 'https://business.google.com/locations'
+        url = config.GBM_URL + '/locations'
         if not self.driver.current_url.startswith(url):
             self.driver.get(url)
             self._wait(5)
@@ -285,9 +287,12 @@ class UploaderSelenium(BaseSelenium):
             obj['final_phone_number'] = obj['phone']
 
             try:
-                self.biz_service.create(**obj)
+                business = self.biz_service.create(**obj)
             except json.decoder.JSONDecodeError:
                 self._start_debug(obj=obj, message="Error creating business.")
                 continue
 
+            if self.writer:
+                self.writer.write(dict(obj, pk=business.raw_data.get('id')))
+
         self.entity.report_success()
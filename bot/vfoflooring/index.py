@@ -0,0 +1,53 @@
+import hashlib
+import json
+
+from ..base.storage import BaseStorage
+
+
+STATUS_ADDED = 'added'
+STATUS_CHANGED = 'changed'
+STATUS_UNCHANGED = 'unchanged'
+
+
+def content_hash(content):
+    content = json.dumps(content, sort_keys=True)
+    return hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+
+class ProductIndex(BaseStorage):
+    filename = 'vfoflooring.sqlite3'
+    table = 'products'
+
+    def get_validators(self, url):
+        product = self.get(url) or {}
+        headers = {}
+        if product.get('etag'):
+            headers['If-None-Match'] = product['etag']
+        if product.get('last_modified'):
+            headers['If-Modified-Since'] = product['last_modified']
+        return headers
+
+    def get_status(self, url, details):
+        product = self.get(url)
+        if product is None:
+            return STATUS_ADDED
+        if product.get('hash') != content_hash(details):
+            return STATUS_CHANGED
+        return STATUS_UNCHANGED
+
+    def is_card_unchanged(self, url, card):
+        product = self.get(url)
+        if product is None:
+            return False
+        return product.get('card_hash') == content_hash(card)
+
+    def save(self, url, card, details=None, etag=None, last_modified=None):
+        product = self.get(url) or {}
+        product.update(
+            card_hash=content_hash(card),
+            etag=etag or product.get('etag'),
+            last_modified=last_modified or product.get('last_modified'),
+        )
+        if details is not None:
+            product.update(sku=details['sku'], hash=content_hash(details))
+        self.set(url, product)
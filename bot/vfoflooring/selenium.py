@@ -3,11 +3,15 @@ from selenium.webdriver.common.by import By
 
 from ..base.selenium import BaseSelenium
 from .. import config
+from .index import (
+    ProductIndex, STATUS_ADDED, STATUS_CHANGED, STATUS_UNCHANGED
+)
 
 
 class VFOSelenium(BaseSelenium):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self.index = ProductIndex()
 
     def __call__(self):
         try:
@@ -17,19 +21,63 @@ class VFOSelenium(BaseSelenium):
             self._wait(10)
         finally:
             self.quit_driver()
+            self.index.close()
 
     def handle(self):
         self.driver = self.get_driver(size=(1200, 700))
         self.go_to_hardwoods()
 
-        links = self.get_list_items()
-        links = list(set(links))
+        summary = {
+            STATUS_ADDED: 0,
+            STATUS_CHANGED: 0,
+            STATUS_UNCHANGED: 0,
+        }
+        for link, card in self.get_list_items():
+            status = self.sync_product(link, card)
+            summary[status] += 1
+
+        self.logger(instance=self, data=summary)
+        print(
+            'Added: {added}, changed: {changed}, '
+            'unchanged: {unchanged}.'.format(**summary)
+        )
 
-        for link in links:
-            details = self.get_product_details(link)
-            self.send_to_airtable(details)
+    def sync_product(self, link, card):
+        response = self.get_product_headers(link)
+        etag = last_modified = None
 
-        self._wait(10)
+        if response is not None:
+            if response.status_code == 304:
+                self.index.save(link, card)
+                return STATUS_UNCHANGED
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+
+        if not any([etag, last_modified]) and \
+                self.index.is_card_unchanged(link, card):
+            return STATUS_UNCHANGED
+
+        details = self.get_product_details(link)
+        status = self.index.get_status(link, details)
+
+        if status != STATUS_UNCHANGED and not self.send_to_airtable(details):
+            return status
+
+        self.index.save(
+            link, card, details, etag=etag, last_modified=last_modified
+        )
+        return status
+
+    def get_product_headers(self, link):
+        try:
+            return requests.head(
+                link,
+                headers=self.index.get_validators(link),
+                allow_redirects=True,
+                timeout=10
+            )
+        except requests.RequestException:
+            return None
 
     def go_to_hardwoods(self):
         self.driver.get(
@@ -43,12 +91,17 @@ class VFOSelenium(BaseSelenium):
             By.CSS_SELECTOR, 'li.product-item'
         )
         response = []
+        links = set()
         for element in elements:
+            card = element.text
             element = self.get_element(
                 By.CSS_SELECTOR, 'a.product-item-link', source=element
             )
             link = element.get_attribute('href')
-            response.append(link)
+            if link in links:
+                continue
+            links.add(link)
+            response.append((link, card))
         return response
 
     def get_product_details(self, link):
@@ -122,5 +175,9 @@ class VFOSelenium(BaseSelenium):
             'Authorization': f'Bearer {config.HA_AIRTABLE_KEY}'
         })
         if response.status_code < 200 or response.status_code > 299:
-            import pdb
-            pdb.set_trace()
+            self._start_debug(
+                message='Airtable error {}.'.format(response.status_code),
+                content=content, response=response.text
+            )
+            return False
+        return True
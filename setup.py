@@ -38,7 +38,9 @@ setup(
     include_package_data=True,
     install_requires=[
         'homoglyphs',
+        'openpyxl',
         'phonenumbers',
+        'psutil',
         'python-dotenv',
         'requests',
         'selenium'